@@ -2,12 +2,15 @@
 Comments module for displaying processed comments from Supabase
 Uses database_api.py for Supabase operations
 """
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
 from fastapi.responses import HTMLResponse
 from datetime import datetime
 import logging
 import hashlib
+import gzip
+import re
 import colorsys
+import functools
 from dateutil import parser as date_parser
 from database.database_api import get_latest_comments
 from database.database import get_database
@@ -28,30 +31,91 @@ def escape_html(text: str) -> str:
             .replace("'", "&#x27;"))
 
 
-@router.get("/comments", response_class=HTMLResponse)
-def comments_page(limit: int = Query(default=50, ge=1, le=200), offset: int = Query(default=0, ge=0)):
-    """Comments page with processed comments from Supabase"""
+# Keyword highlighting: lowercase and capitalized forms of each word, longest first
+# so "thanks" is not split by "thank". Compiled once instead of scanning the text per word.
+NEGATIVE_WORDS = ["scam", "error", "broken", "lost", "luntay", "dispute", "problem", "issue"]
+POSITIVE_WORDS = ["mahadsanid", "thank", "thanks", "good", "wacan"]
+HIGHLIGHT_CLASSES = {
+    **{form: "highlight-red" for word in NEGATIVE_WORDS for form in (word, word.capitalize())},
+    **{form: "highlight-green" for word in POSITIVE_WORDS for form in (word, word.capitalize())},
+}
+HIGHLIGHT_RE = re.compile("|".join(re.escape(form) for form in sorted(HIGHLIGHT_CLASSES, key=len, reverse=True)))
+
+
+def _highlight_word(match: "re.Match[str]") -> str:
+    """Wrap matched keyword in its highlight span"""
+    word = match.group(0)
+    return f'<span class="{HIGHLIGHT_CLASSES[word]}">{word}</span>'
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse timestamp string returned by the database
+    
+    Database timestamps are ISO 8601, which datetime.fromisoformat parses in C.
+    dateutil is only used for other formats.
+    
+    Args:
+        value: Timestamp string
+    
+    Returns:
+        Parsed datetime
+    """
     try:
-        # Get processed comments from Supabase (already includes joined data)
-        comments_data = get_latest_comments(limit=limit, offset=offset, is_reviewed=None)
-        
-        # Use the flattened data directly
-        total = len(comments_data)  # Approximate total (could be improved with count query)
-        fetch_success = True
-        
-    except Exception as e:
-        logger.error(f"Error loading comments: {e}")
-        comments_data = []
-        total = 0
-        fetch_success = False
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return date_parser.parse(value)
+
+
+def accepted_encodings(header: str) -> set:
+    """
+    Parse Accept-Encoding header into the set of acceptable encodings
     
-    # Determine status class and icon
-    status_class = "online" if fetch_success else "offline"
-    status_icon = "🟢" if fetch_success else "🔴"
-    fetch_time_str = datetime.now().strftime('%H:%M:%S')
+    Args:
+        header: Accept-Encoding header value
+    
+    Returns:
+        Encoding tokens, without those the client refuses with q=0
+    """
+    accepted = set()
+    for item in header.lower().split(","):
+        encoding, _, params = item.partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(encoding.strip())
+    return accepted
+
+
+@functools.lru_cache(maxsize=256)
+def risk_color(risk: str) -> str:
+    """
+    Get consistent badge color for a risk string
+    
+    Risk strings repeat across comments, so each color is computed once.
     
-    # Build HTML - CSS as regular string, body with variables as f-string
-    html_content = """
+    Args:
+        risk: Risk assessment string from AI
+    
+    Returns:
+        Hex color derived from the risk string hash
+    """
+    # Generate consistent color based on risk string hash
+    hash_obj = hashlib.md5(risk.encode())
+    hash_int = int(hash_obj.hexdigest(), 16)
+    # Generate color in HSL format, convert to RGB
+    hue = hash_int % 360
+    saturation = 60 + (hash_int % 20)  # 60-80%
+    lightness = 45 + (hash_int % 15)  # 45-60%
+    # Convert HSL to RGB (simplified)
+    rgb = colorsys.hls_to_rgb(hue/360, lightness/100, saturation/100)
+    return f"#{int(rgb[0]*255):02x}{int(rgb[1]*255):02x}{int(rgb[2]*255):02x}"
+
+
+# Smaller pages are not worth compressing
+COMPRESS_MIN_SIZE = 1024
+
+# Page head, styles and header start never change, so they are built once at import
+COMMENTS_PAGE_HEAD = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -382,6 +446,33 @@ def comments_page(limit: int = Query(default=50, ge=1, le=200), offset: int = Qu
             <div class="header-left">
                 <h1>COMMENTS</h1>
                 <div class="monitoring">Monitoring: Premier Bank Official Page</div>
+"""
+
+
+@router.get("/comments", response_class=HTMLResponse)
+def comments_page(req: Request, limit: int = Query(default=50, ge=1, le=200), offset: int = Query(default=0, ge=0)):
+    """Comments page with processed comments from Supabase"""
+    try:
+        # Get processed comments from Supabase (already includes joined data)
+        comments_data = get_latest_comments(limit=limit, offset=offset, is_reviewed=None)
+        
+        # Use the flattened data directly
+        total = len(comments_data)  # Approximate total (could be improved with count query)
+        fetch_success = True
+        
+    except Exception as e:
+        logger.error("Error loading comments: %s", e)
+        comments_data = []
+        total = 0
+        fetch_success = False
+    
+    # Determine status class and icon
+    status_class = "online" if fetch_success else "offline"
+    status_icon = "🟢" if fetch_success else "🔴"
+    fetch_time_str = datetime.now().strftime('%H:%M:%S')
+    
+    # Build HTML - static head is a module constant, body with variables as f-strings
+    parts = [COMMENTS_PAGE_HEAD, """
                 <div class="last-update """ + status_class + """">
                     <span>""" + status_icon + """</span>
                     <span>Last update: """ + fetch_time_str + """</span>
@@ -394,15 +485,15 @@ def comments_page(limit: int = Query(default=50, ge=1, le=200), offset: int = Qu
         </div>
         
         <div class="feed-container" id="feed-container">
-    """
+    """]
     
     if not comments_data:
-        html_content += """
+        parts.append("""
             <div class="empty-state">
                 <h2>📭 No comments found</h2>
                 <p>Start scraping to add comments to the feed.</p>
             </div>
-        """
+        """)
     else:
         comment_index = total - offset
         for comment in comments_data:
@@ -426,33 +517,20 @@ def comments_page(limit: int = Query(default=50, ge=1, le=200), offset: int = Qu
             model_name = comment.get("model_name") or ""
             
             # Format date
-            time_str = ""
             date_str = ""
             if created_at:
                 try:
                     if isinstance(created_at, str):
-                        dt = date_parser.parse(created_at)
-                        time_str = dt.strftime("%H:%M:%S")
-                        date_str = dt.strftime("%Y-%m-%d %H:%M:%S")
+                        date_str = parse_timestamp(created_at).strftime("%Y-%m-%d %H:%M:%S")
                     elif hasattr(created_at, 'strftime'):
-                        time_str = created_at.strftime("%H:%M:%S")
                         date_str = created_at.strftime("%Y-%m-%d %H:%M:%S")
                 except (ValueError, AttributeError, TypeError) as e:
-                    logger.debug(f"Could not parse date: {e}")
+                    logger.debug("Could not parse date: %s", e)
                     pass
             
             # Generate random color for risk if risk is present, otherwise use threat level color
             if risk:
-                # Generate consistent color based on risk string hash
-                hash_obj = hashlib.md5(risk.encode())
-                hash_int = int(hash_obj.hexdigest(), 16)
-                # Generate color in HSL format, convert to RGB
-                hue = hash_int % 360
-                saturation = 60 + (hash_int % 20)  # 60-80%
-                lightness = 45 + (hash_int % 15)  # 45-60%
-                # Convert HSL to RGB (simplified)
-                rgb = colorsys.hls_to_rgb(hue/360, lightness/100, saturation/100)
-                category_color_hex = f"#{int(rgb[0]*255):02x}{int(rgb[1]*255):02x}{int(rgb[2]*255):02x}"
+                category_color_hex = risk_color(risk)
             else:
                 # Use threat level color if no risk
                 category_color_hex = threat_level_color
@@ -466,26 +544,14 @@ def comments_page(limit: int = Query(default=50, ge=1, le=200), offset: int = Qu
             elif sentiment_slug == "friendly":
                 category_color = "green"
             
-            # Highlight keywords (simple keyword detection)
-            highlighted_content = escape_html(content)
-            negative_words = ["scam", "error", "broken", "lost", "luntay", "dispute", "problem", "issue"]
-            positive_words = ["mahadsanid", "thank", "thanks", "good", "wacan"]
-            
-            for word in negative_words:
-                if word.lower() in highlighted_content.lower():
-                    highlighted_content = highlighted_content.replace(word, f'<span class="highlight-red">{word}</span>')
-                    highlighted_content = highlighted_content.replace(word.capitalize(), f'<span class="highlight-red">{word.capitalize()}</span>')
-            
-            for word in positive_words:
-                if word.lower() in highlighted_content.lower():
-                    highlighted_content = highlighted_content.replace(word, f'<span class="highlight-green">{word}</span>')
-                    highlighted_content = highlighted_content.replace(word.capitalize(), f'<span class="highlight-green">{word.capitalize()}</span>')
+            # Highlight keywords (simple keyword detection), one regex pass over the text
+            highlighted_content = HIGHLIGHT_RE.sub(_highlight_word, escape_html(content))
             
             # Determine language
             language = "ENGLISH"
             if dialect:
                 language = f"SOMALI ({dialect.upper()})"
-            elif any(ord(c) > 127 for c in content):
+            elif not content.isascii():
                 language = "SOMALI"
             
             # Build translation HTML if available
@@ -498,7 +564,7 @@ def comments_page(limit: int = Query(default=50, ge=1, le=200), offset: int = Qu
             if confidence_score:
                 confidence_html = f'<div class="language-tag">Confidence: {confidence_score:.0%}</div>'
             
-            html_content += f"""
+            parts.append(f"""
             <div class="comment-entry">
                 <div class="user-badge">
                     <div class="user-number">{comment_index}</div>
@@ -531,7 +597,7 @@ def comments_page(limit: int = Query(default=50, ge=1, le=200), offset: int = Qu
                     <div class="category-btn {category_color}" style="background-color: {category_color_hex};">{escape_html(display_category).replace('_', ' ').title()}</div>
                 </div>
             </div>
-            """
+            """)
             comment_index -= 1
     
     # Pagination
@@ -540,31 +606,31 @@ def comments_page(limit: int = Query(default=50, ge=1, le=200), offset: int = Qu
     current_page = (current_offset // current_limit) + 1
     total_pages = (total + current_limit - 1) // current_limit if total > 0 else 1
     
-    html_content += f"""
+    parts.append(f"""
         </div>
         
         <div class="pagination">
-    """
+    """)
     
     if current_page > 1:
         prev_offset = max(0, current_offset - current_limit)
-        html_content += f'<button onclick="loadPage({prev_offset})">← Previous</button>'
+        parts.append(f'<button onclick="loadPage({prev_offset})">← Previous</button>')
     else:
-        html_content += '<button disabled>← Previous</button>'
+        parts.append('<button disabled>← Previous</button>')
     
-    html_content += f"""
+    parts.append(f"""
             <span class="pagination-info">
                 Page {current_page} of {total_pages} (showing {len(comments_data)} of {total})
             </span>
-    """
+    """)
     
     if current_offset + current_limit < total:
         next_offset = current_offset + current_limit
-        html_content += f'<button onclick="loadPage({next_offset})">Next →</button>'
+        parts.append(f'<button onclick="loadPage({next_offset})">Next →</button>')
     else:
-        html_content += '<button disabled>Next →</button>'
+        parts.append('<button disabled>Next →</button>')
     
-    html_content += f"""
+    parts.append(f"""
         </div>
         
         <script>
@@ -581,14 +647,21 @@ def comments_page(limit: int = Query(default=50, ge=1, le=200), offset: int = Qu
         </script>
     </body>
     </html>
-    """
+    """)
     
     # Add headers to prevent caching
     headers = {
         "Cache-Control": "no-cache, no-store, must-revalidate",
         "Pragma": "no-cache",
-        "Expires": "0"
+        "Expires": "0",
+        "Vary": "Accept-Encoding"
     }
     
-    return HTMLResponse(content=html_content, headers=headers)
+    body = "".join(parts).encode("utf-8")
+    # Page is rebuilt per request, so a fast compression level; styles and markup compress well
+    if len(body) >= COMPRESS_MIN_SIZE and "gzip" in accepted_encodings(req.headers.get("accept-encoding", "")):
+        body = gzip.compress(body, compresslevel=5)
+        headers["Content-Encoding"] = "gzip"
+    
+    return HTMLResponse(content=body, headers=headers)
 
@@ -1,10 +1,17 @@
 """
 Database module for Supabase
-Provides abstraction layer for Supabase operations
+Provides abstraction layer for Supabase operations and an optional asyncpg pool
+
+Durability: the pooled comment insert (add_comment_with_processing_async) commits
+with synchronous_commit=off, so it returns before its WAL record is flushed to
+disk. A database crash can lose the last few hundred milliseconds of those
+inserts (never corrupts data). Other pooled statements commit durably.
 """
+import asyncio
 import logging
 import os
 from typing import Optional, Any
+import orjson
 from dotenv import load_dotenv
 
 try:
@@ -17,17 +24,50 @@ except ImportError:
     Client = None  # type: ignore
     ClientOptions = None  # type: ignore
 
+try:
+    import asyncpg  # type: ignore
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
+    asyncpg = None  # type: ignore
+
+try:
+    import httpx  # type: ignore
+except ImportError:
+    httpx = None  # type: ignore
+
 # Load environment variables from .env
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 
+# Errors meaning the database could not be reached or did not answer in time,
+# as opposed to a statement the database rejected (constraint violations, bad input)
+CONNECTION_ERRORS: tuple = (OSError, asyncio.TimeoutError)
+if ASYNCPG_AVAILABLE:
+    CONNECTION_ERRORS += (asyncpg.PostgresConnectionError, asyncpg.InterfaceError)
+if httpx is not None:
+    # Supabase client talks to PostgREST over httpx
+    CONNECTION_ERRORS += (httpx.TransportError,)
+
+
+# Bounds on waiting for the database: a slow or overloaded database raises
+# asyncio.TimeoutError (one of CONNECTION_ERRORS) instead of leaving requests hanging
+POOL_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT_SECONDS", "5"))
+COMMAND_TIMEOUT_SECONDS = float(os.getenv("DB_COMMAND_TIMEOUT_SECONDS", "10"))
+
+
+class DatabaseUnavailableError(Exception):
+    """Raised by database helpers when the database cannot be reached or times out"""
+
+
 class Database:
     """
     Database wrapper for Supabase
     
-    Provides Supabase client for database and storage operations
+    Provides Supabase client for database and storage operations, and an
+    asyncpg connection pool for direct non-blocking writes when DATABASE_URL is set
     """
     
     def __init__(self):
@@ -37,6 +77,7 @@ class Database:
         Automatically initializes Supabase client using environment variables from .env file.
         """
         self._supabase_client: Optional[Any] = None  # type: ignore
+        self._pool: Optional[Any] = None  # type: ignore
         
         # Auto-initialize Supabase client if credentials available
         if SUPABASE_AVAILABLE and create_client is not None:
@@ -66,7 +107,7 @@ class Database:
                     self._supabase_client = create_client(supabase_url, supabase_key)
                 logger.info("Supabase client initialized successfully")
             except Exception as e:
-                logger.warning(f"Failed to initialize Supabase client: {e}")
+                logger.warning("Failed to initialize Supabase client: %s", e)
 
     @property
     def supabase(self) -> Optional[Any]:  # type: ignore
@@ -78,6 +119,64 @@ class Database:
         """
         return self._supabase_client
 
+    async def init_pool(self) -> None:
+        """
+        Create asyncpg connection pool if DATABASE_URL is set
+        
+        Without a pool, callers fall back to the Supabase client.
+        """
+        if self._pool is not None:
+            return
+        
+        database_url = os.getenv("DATABASE_URL")
+        if not database_url or not ASYNCPG_AVAILABLE:
+            logger.info("DATABASE_URL is not set or asyncpg is not installed, using Supabase client for writes")
+            return
+        
+        try:
+            # Connections are opened once and reused; idle ones above min_size are closed after a while
+            self._pool = await asyncpg.create_pool(
+                database_url,
+                min_size=int(os.getenv("DB_POOL_MIN_SIZE", "5")),
+                max_size=int(os.getenv("DB_POOL_MAX_SIZE", "20")),
+                max_inactive_connection_lifetime=float(os.getenv("DB_POOL_MAX_IDLE_SECONDS", "300")),
+                # Statements are prepared once per connection and reused by their (constant) SQL text.
+                # Set to 0 behind a transaction-mode pooler (e.g. Supabase port 6543), which cannot keep them
+                statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100")),
+                command_timeout=COMMAND_TIMEOUT_SECONDS,
+                init=_init_connection,
+            )
+            logger.info("PostgreSQL connection pool initialized")
+        except Exception as e:
+            logger.warning("Failed to initialize PostgreSQL connection pool: %s", e)
+    
+    async def close_pool(self) -> None:
+        """Close asyncpg connection pool"""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+    
+    @property
+    def pool(self) -> Optional[Any]:  # type: ignore
+        """
+        Get asyncpg connection pool
+        
+        Returns:
+            asyncpg Pool if initialized, None otherwise
+        """
+        return self._pool
+
+
+async def _init_connection(conn: Any) -> None:
+    """Decode and encode json/jsonb columns with orjson on every pooled connection"""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=lambda value: orjson.dumps(value).decode("utf-8"),
+            decoder=orjson.loads,
+            schema="pg_catalog",
+        )
+
 # Global database instance (will be set during app startup)
 _db_instance: Optional[Database] = None
 
@@ -3,9 +3,9 @@ Database API module for Supabase operations
 Provides high-level methods for working with Supabase Storage and Database
 """
 import logging
+import time
 from typing import Dict, Any, List, Optional
-from datetime import datetime
-from database.database import get_database
+from database.database import get_database, CONNECTION_ERRORS, POOL_ACQUIRE_TIMEOUT_SECONDS, DatabaseUnavailableError
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +24,8 @@ def get_latest_comments(limit: int = 50, offset: int = 0,
         List of comment dictionaries with all fields including joined data
     """
     try:
-        request_start_time = datetime.now()
+        # Monotonic integer clock: immune to wall-clock jumps, no datetime objects per request
+        request_start_ns = time.perf_counter_ns()
         db = get_database()
         supabase = db.supabase
         
@@ -32,7 +33,7 @@ def get_latest_comments(limit: int = 50, offset: int = 0,
             logger.error("Supabase client is not initialized")
             return []
         
-        logger.info(f"[SUPABASE] Fetching comments from Supabase (limit={limit}, offset={offset}) at {request_start_time.isoformat()}")
+        logger.info("[SUPABASE] Fetching comments from Supabase (limit=%s, offset=%s)", limit, offset)
         
         # Build query with joins to get related data
         # Join with raw_comments, complaint_categories, sentiment_types, and threat_levels
@@ -60,11 +61,10 @@ def get_latest_comments(limit: int = 50, offset: int = 0,
             .execute()
         )
         
-        request_end_time = datetime.now()
-        request_duration = (request_end_time - request_start_time).total_seconds()
+        request_duration = (time.perf_counter_ns() - request_start_ns) / 1e9
         
         comments = response.data if hasattr(response, 'data') else []
-        logger.info(f"[SUPABASE] Successfully fetched {len(comments)} comments in {request_duration:.3f}s at {request_end_time.isoformat()}")
+        logger.info("[SUPABASE] Successfully fetched %d comments in %.3fs", len(comments), request_duration)
         
         # Flatten the nested structure for easier access
         flattened_comments = []
@@ -128,12 +128,12 @@ def get_latest_comments(limit: int = 50, offset: int = 0,
             
             flattened_comments.append(flattened)
         
-        logger.info(f"[SUPABASE] Retrieved {len(flattened_comments)} comments (flattened)")
+        logger.info("[SUPABASE] Retrieved %d comments (flattened)", len(flattened_comments))
         
         return flattened_comments
         
     except Exception as e:
-        logger.error(f"[SUPABASE] Error getting latest comments: {e}", exc_info=True)
+        logger.error("[SUPABASE] Error getting latest comments: %s", e, exc_info=True)
         return []
 
 
@@ -151,6 +151,9 @@ def add_raw_comment(fb_comment_id: str, post_id: int, author_name: Optional[str]
     
     Returns:
         Dictionary with inserted comment data or None if error
+    
+    Raises:
+        DatabaseUnavailableError: If the database cannot be reached or times out
     """
     try:
         db = get_database()
@@ -175,12 +178,15 @@ def add_raw_comment(fb_comment_id: str, post_id: int, author_name: Optional[str]
         )
         
         result = response.data[0] if response.data else None
-        logger.info(f"Raw comment added: {fb_comment_id}")
+        logger.info("Raw comment added: %s", fb_comment_id)
         
         return result
         
+    except CONNECTION_ERRORS as e:
+        logger.error("Database unavailable while adding raw comment: %s", e)
+        raise DatabaseUnavailableError(str(e)) from e
     except Exception as e:
-        logger.error(f"Error adding raw comment: {e}")
+        logger.error("Error adding raw comment: %s", e)
         return None
 
 
@@ -208,6 +214,9 @@ def add_processed_comment(raw_comment_id: int, translation_en: Optional[str] = N
     
     Returns:
         Dictionary with inserted processed comment data or None if error
+    
+    Raises:
+        DatabaseUnavailableError: If the database cannot be reached or times out
     """
     try:
         db = get_database()
@@ -273,12 +282,15 @@ def add_processed_comment(raw_comment_id: int, translation_en: Optional[str] = N
         )
         
         result = response.data[0] if response.data else None
-        logger.info(f"Processed comment added for raw_comment_id: {raw_comment_id}")
+        logger.info("Processed comment added for raw_comment_id: %s", raw_comment_id)
         
         return result
         
+    except CONNECTION_ERRORS as e:
+        logger.error("Database unavailable while adding processed comment: %s", e)
+        raise DatabaseUnavailableError(str(e)) from e
     except Exception as e:
-        logger.error(f"Error adding processed comment: {e}")
+        logger.error("Error adding processed comment: %s", e)
         return None
 
 
@@ -357,6 +369,116 @@ def add_comment_with_processing(fb_comment_id: str, post_id: int,
         }
         
     except Exception as e:
-        logger.error(f"Error adding comment with processing: {e}")
+        logger.error("Error adding comment with processing: %s", e)
         return None
 
+
+# ========== Direct PostgreSQL operations (asyncpg pool) ==========
+
+# Both rows are inserted by one statement: one round-trip and one commit per comment.
+# Reference slugs are resolved to IDs inside the statement.
+# The text never changes, so asyncpg prepares it once per connection and reuses the plan.
+# Idempotent: saving the same fb_comment_id again returns the existing rows.
+# The no-op DO UPDATE makes RETURNING yield the existing raw comment.
+INSERT_COMMENT_WITH_PROCESSING_SQL = """
+WITH raw AS (
+    INSERT INTO raw_comments (fb_comment_id, post_id, author_name, content, parent_comment_id)
+    VALUES ($1, $2, $3, $4, $5)
+    ON CONFLICT (fb_comment_id) DO UPDATE SET fb_comment_id = EXCLUDED.fb_comment_id
+    RETURNING *
+), processed AS (
+    INSERT INTO processed_comments (
+        raw_comment_id, category_id, sentiment_id, threat_level_id,
+        translation_en, confidence_score, dialect, keywords, risk, model_name, is_reviewed
+    )
+    SELECT
+        raw.id,
+        (SELECT id FROM complaint_categories WHERE slug = $6),
+        (SELECT id FROM sentiment_types WHERE slug = $7),
+        (SELECT id FROM threat_levels WHERE slug = $8),
+        $9::text, $10::real, $11::text, $12::text[], $13::text, $14::text, $15::boolean
+    FROM raw
+    ON CONFLICT (raw_comment_id) DO NOTHING
+    RETURNING *
+)
+SELECT
+    row_to_json(raw.*) AS raw_comment,
+    COALESCE(
+        (SELECT row_to_json(processed.*) FROM processed),
+        (SELECT row_to_json(p.*) FROM processed_comments p WHERE p.raw_comment_id = raw.id)
+    ) AS processed_comment
+FROM raw
+"""
+
+
+SYNCHRONOUS_COMMIT_OFF_SQL = "SET LOCAL synchronous_commit = off"
+
+
+async def add_comment_with_processing_async(pool: Any, fb_comment_id: str, post_id: int,
+                                            author_name: Optional[str] = None, content: Optional[str] = None,
+                                            parent_comment_id: Optional[int] = None,
+                                            translation_en: Optional[str] = None,
+                                            category_slug: Optional[str] = None,
+                                            sentiment_slug: Optional[str] = None,
+                                            threat_level_slug: Optional[str] = None,
+                                            confidence_score: Optional[float] = None,
+                                            dialect: Optional[str] = None,
+                                            keywords: Optional[List[str]] = None,
+                                            risk: Optional[str] = None,
+                                            model_name: Optional[str] = None,
+                                            is_reviewed: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Add both raw comment and processed comment in a single statement without blocking the event loop
+    
+    Args:
+        pool: asyncpg connection pool
+        fb_comment_id: Unique Facebook comment ID
+        post_id: ID of the parent post
+        author_name: Name of the comment author
+        content: Comment text content
+        parent_comment_id: ID of parent comment (for reply threads)
+        translation_en: English translation of the comment
+        category_slug: Slug of the complaint category
+        sentiment_slug: Slug of the sentiment type
+        threat_level_slug: Slug of the threat level
+        confidence_score: AI confidence score (0.0-1.0)
+        dialect: Dialect detected ('Maxa-tiri' or 'Maay')
+        keywords: List of keywords extracted
+        risk: Risk assessment string from AI
+        model_name: Model name used for processing
+        is_reviewed: Whether the comment has been reviewed by human
+    
+    Returns:
+        Dictionary with both raw and processed comment data or None if error
+    
+    Raises:
+        DatabaseUnavailableError: If the database cannot be reached or times out
+    """
+    try:
+        async with pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT_SECONDS) as conn:
+            async with conn.transaction():
+                # Skip the WAL fsync wait for this commit only (see database module docstring)
+                await conn.execute(SYNCHRONOUS_COMMIT_OFF_SQL)
+                row = await conn.fetchrow(
+                    INSERT_COMMENT_WITH_PROCESSING_SQL,
+                    fb_comment_id, post_id, author_name, content, parent_comment_id,
+                    category_slug, sentiment_slug, threat_level_slug,
+                    translation_en, confidence_score, dialect, keywords or [], risk, model_name, is_reviewed
+                )
+        
+        if row is None:
+            logger.error("Failed to add comment with processing")
+            return None
+        
+        logger.info("Comment with processing added: %s", fb_comment_id)
+        return {
+            "raw_comment": row["raw_comment"],
+            "processed_comment": row["processed_comment"]
+        }
+        
+    except CONNECTION_ERRORS as e:
+        logger.error("Database unavailable while adding comment with processing: %s", e)
+        raise DatabaseUnavailableError(str(e)) from e
+    except Exception as e:
+        logger.error("Error adding comment with processing: %s", e)
+        return None
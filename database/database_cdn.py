@@ -41,11 +41,11 @@ def download_photo_to_file(bucket_name: str, file_path: str, local_file_path: st
         with open(local_file_path, "wb+") as f:
             f.write(response)
         
-        logger.info(f"Photo downloaded successfully: {file_path} -> {local_file_path}")
+        logger.info("Photo downloaded successfully: %s -> %s", file_path, local_file_path)
         return True
         
     except Exception as e:
-        logger.error(f"Error downloading photo: {e}")
+        logger.error("Error downloading photo: %s", e)
         return False
         
 def upload_photo(bucket_name: str, file_path: str, file_data: bytes, 
@@ -2,8 +2,9 @@
 Model Parser for Gemini responses
 Parses JSON responses from Gemini API and extracts structured data
 """
-import json
 import logging
+import functools
+import orjson
 from typing import Optional
 from database.models import ProcessedCommentCreate
 
@@ -18,6 +19,8 @@ class ModelParser:
         """
         Parse JSON response from Gemini API and return ProcessedCommentCreate model
         
+        Identical responses (retries, cached model answers) are parsed once.
+        
         Args:
             response_text: Raw text response from Gemini (should contain JSON)
             raw_comment_id: Optional raw_comment_id if already known
@@ -26,6 +29,14 @@ class ModelParser:
             ProcessedCommentCreate model instance with parsed data
             Returns None if parsing fails
         """
+        processed_comment = ModelParser._parse_cached(response_text, raw_comment_id)
+        # Copy so callers can modify the result without corrupting the cache
+        return processed_comment.model_copy() if processed_comment is not None else None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_cached(response_text: str, raw_comment_id: Optional[int]) -> Optional[ProcessedCommentCreate]:
+        """Parse response text, memoized by (response_text, raw_comment_id)"""
         try:
             # Try to extract JSON from response text
             # Gemini might return JSON wrapped in markdown code blocks or plain JSON
@@ -43,7 +54,7 @@ class ModelParser:
             text = text.strip()
             
             # Parse JSON
-            parsed_data = json.loads(text)
+            parsed_data = orjson.loads(text)
             
             # Extract fields according to ProcessedComment model
             threat_level_slug = parsed_data.get("threat_level")
@@ -59,10 +70,10 @@ class ModelParser:
                     confidence_score = float(confidence_score)
                     # Ensure it's in valid range
                     if confidence_score < 0.0 or confidence_score > 1.0:
-                        logger.warning(f"confidence_score out of range: {confidence_score}, clamping to [0.0, 1.0]")
+                        logger.warning("confidence_score out of range: %s, clamping to [0.0, 1.0]", confidence_score)
                         confidence_score = max(0.0, min(1.0, confidence_score))
                 except (ValueError, TypeError):
-                    logger.warning(f"Invalid confidence_score: {confidence_score}")
+                    logger.warning("Invalid confidence_score: %s", confidence_score)
                     confidence_score = None
             
             # Extract risk from response
@@ -82,18 +93,18 @@ class ModelParser:
                 is_reviewed=False
             )
             
-            logger.info(f"Successfully parsed Gemini response into ProcessedCommentCreate: "
-                       f"translation_en={processed_comment.translation_en}, "
-                       f"threat_level_slug={processed_comment.threat_level_slug}, "
-                       f"confidence_score={processed_comment.confidence_score}")
+            logger.info("Successfully parsed Gemini response into ProcessedCommentCreate: "
+                        "translation_en=%s, threat_level_slug=%s, confidence_score=%s",
+                        processed_comment.translation_en, processed_comment.threat_level_slug,
+                        processed_comment.confidence_score)
             
             return processed_comment
             
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON from Gemini response: {e}")
-            logger.debug(f"Response text: {response_text}")
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse JSON from Gemini response: %s", e)
+            logger.debug("Response text: %s", response_text)
             return None
         except Exception as e:
-            logger.error(f"Error parsing Gemini response: {e}", exc_info=True)
+            logger.error("Error parsing Gemini response: %s", e, exc_info=True)
             return None
 
@@ -2,8 +2,8 @@
 Database models for Gaado Backend
 Pydantic models matching database schema
 """
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+from typing import Annotated, Optional, List, Dict, Any
 from datetime import datetime
 
 
@@ -37,9 +37,8 @@ class ProcessedComment(BaseModel):
     # Timestamp (set by database)
     processed_at: Optional[datetime] = None
     
-    class Config:
-        """Pydantic config"""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "raw_comment_id": 1,
                 "translation_en": "This is an English translation",
@@ -51,6 +50,7 @@ class ProcessedComment(BaseModel):
                 "is_reviewed": False
             }
         }
+    )
 
 
 class ProcessedCommentCreate(BaseModel):
@@ -86,7 +86,20 @@ class SaveProcessedCommentRequest(BaseModel):
     confidence_score: Optional[float] = Field(default=None, description="Confidence score")
     dialect: Optional[str] = Field(default=None, description="Dialect")
     keywords: Optional[List[str]] = Field(default=None, description="Keywords")
-    somali_text: Optional[str] = Field(default=None, description="Original Somali text")
+    # Rejected with 422 before any DB work if empty or oversized
+    somali_text: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=8192)] = Field(
+        ..., description="Original Somali text"
+    )
     risk: Optional[str] = Field(default=None, description="Risk assessment string")
     model_name: Optional[str] = Field(default=None, description="Model name used for processing")
 
+
+class SaveProcessedCommentResponse(BaseModel):
+    """Model for save processed comment response"""
+    model_config = ConfigDict(frozen=True)
+    
+    success: bool = Field(..., description="Whether the comment was saved (or queued)")
+    raw_comment_id: Optional[int] = Field(default=None, description="ID of the saved raw comment")
+    processed_comment: Optional[Dict[str, Any]] = Field(default=None, description="Saved processed comment data")
+    queued: Optional[bool] = Field(default=None, description="True if the comment was queued for a background write")
+    error: Optional[str] = Field(default=None, description="Error message if saving failed")
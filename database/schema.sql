@@ -86,7 +86,7 @@ CREATE TABLE IF NOT EXISTS processed_comments (
     translation_en TEXT,               -- English translation
     confidence_score REAL,             -- Probability (e.g., 0.98)
     dialect TEXT,                      -- 'Maxa-tiri' or 'Maay' [cite: 36]
-    keywords JSONB,                    -- List of words: ["scam", "error"]
+    keywords TEXT[],                   -- List of words: {scam,error}
     risk TEXT,                         -- Risk assessment string from AI
     model_name TEXT,                   -- Model name used for processing (e.g., "Qwen/Qwen2.5-7B-Instruct:together")
     
@@ -212,7 +212,7 @@ SELECT
     'Hahaha, I listened to an advertisement that was like a song, a Rap advertisement. Black Horse couldn''t make it clear, it is creativity.',
     0.95,
     'Maxa-tiri',
-    '[]'::JSONB,
+    '{}'::TEXT[],
     FALSE
 WHERE NOT EXISTS (SELECT 1 FROM processed_comments WHERE raw_comment_id = (SELECT id FROM raw_comments WHERE fb_comment_id = 'mock_comment_001'));
 
@@ -223,7 +223,7 @@ SELECT
     'It''s the only bank that solves its customers'' technical issues by telling them to log out, restart, delete, and reinstall.',
     0.95,
     'Maxa-tiri',
-    '[]'::JSONB,
+    '{}'::TEXT[],
     FALSE
 WHERE NOT EXISTS (SELECT 1 FROM processed_comments WHERE raw_comment_id = (SELECT id FROM raw_comments WHERE fb_comment_id = 'mock_comment_002'));
 
@@ -234,7 +234,7 @@ SELECT
     'The day you introduce international ATM deposits [deposits that can be done from the world], you will become number one.',
     0.98,
     'Maxa-tiri',
-    '[]'::JSONB,
+    '{}'::TEXT[],
     FALSE
 WHERE NOT EXISTS (SELECT 1 FROM processed_comments WHERE raw_comment_id = (SELECT id FROM raw_comments WHERE fb_comment_id = 'mock_comment_003'));
 
@@ -245,7 +245,7 @@ SELECT
     'Premier Bank, what is the situation? Is this the extent of the advertising? Okay, no problem, but did you pay [wet the pockets of] the team that made the ad for you, or did you just order them lunch? The poor things, let a clip be filmed of them being paid their money so we can verify it via VAR.',
     0.95,
     'Maxa-tiri',
-    '[]'::JSONB,
+    '{}'::TEXT[],
     FALSE
 WHERE NOT EXISTS (SELECT 1 FROM processed_comments WHERE raw_comment_id = (SELECT id FROM raw_comments WHERE fb_comment_id = 'mock_comment_004'));
 
@@ -256,7 +256,7 @@ SELECT
     'The only bank that solves the problem facing it with another problem.',
     0.95,
     'Maxa-tiri',
-    '[]'::JSONB,
+    '{}'::TEXT[],
     FALSE
 WHERE NOT EXISTS (SELECT 1 FROM processed_comments WHERE raw_comment_id = (SELECT id FROM raw_comments WHERE fb_comment_id = 'mock_comment_005'));
 
@@ -267,7 +267,7 @@ SELECT
     'If I memorize this song, I wonder if I get a free card.',
     0.98,
     'Maxa-tiri',
-    '[]'::JSONB,
+    '{}'::TEXT[],
     FALSE
 WHERE NOT EXISTS (SELECT 1 FROM processed_comments WHERE raw_comment_id = (SELECT id FROM raw_comments WHERE fb_comment_id = 'mock_comment_006'));
 
@@ -278,7 +278,7 @@ SELECT
     'You advertise very much, and you are very weak [incompetent]!',
     0.99,
     'Maxa-tiri',
-    '[]'::JSONB,
+    '{}'::TEXT[],
     FALSE
 WHERE NOT EXISTS (SELECT 1 FROM processed_comments WHERE raw_comment_id = (SELECT id FROM raw_comments WHERE fb_comment_id = 'mock_comment_007'));
 
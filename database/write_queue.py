@@ -0,0 +1,270 @@
+"""
+Write-behind queue for comment saves
+Buffers comments in memory and writes them to PostgreSQL in batches
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from database.database import CONNECTION_ERRORS, POOL_ACQUIRE_TIMEOUT_SECONDS
+from database.database_api import INSERT_COMMENT_WITH_PROCESSING_SQL
+
+logger = logging.getLogger(__name__)
+
+
+# Batches are COPY'd into a per-connection temp table, then moved into the real
+# tables by one INSERT ... SELECT. COPY skips per-row statement parsing.
+STAGING_COLUMNS = (
+    "fb_comment_id", "post_id", "author_name", "content", "parent_comment_id",
+    "category_slug", "sentiment_slug", "threat_level_slug",
+    "translation_en", "confidence_score", "dialect", "keywords", "risk", "model_name", "is_reviewed",
+)
+
+CREATE_STAGING_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS comment_staging (
+    fb_comment_id TEXT,
+    post_id INTEGER,
+    author_name TEXT,
+    content TEXT,
+    parent_comment_id INTEGER,
+    category_slug TEXT,
+    sentiment_slug TEXT,
+    threat_level_slug TEXT,
+    translation_en TEXT,
+    confidence_score REAL,
+    dialect TEXT,
+    keywords TEXT[],
+    risk TEXT,
+    model_name TEXT,
+    is_reviewed BOOLEAN
+) ON COMMIT DELETE ROWS
+"""
+
+# Raw comments are matched back to staged rows by the unique fb_comment_id.
+# Duplicates (within the batch or already stored) are skipped.
+INSERT_FROM_STAGING_SQL = """
+WITH staged AS (
+    SELECT DISTINCT ON (fb_comment_id) * FROM comment_staging
+), raw AS (
+    INSERT INTO raw_comments (fb_comment_id, post_id, author_name, content, parent_comment_id)
+    SELECT fb_comment_id, post_id, author_name, content, parent_comment_id FROM staged
+    ON CONFLICT (fb_comment_id) DO NOTHING
+    RETURNING id, fb_comment_id
+)
+INSERT INTO processed_comments (
+    raw_comment_id, category_id, sentiment_id, threat_level_id,
+    translation_en, confidence_score, dialect, keywords, risk, model_name, is_reviewed
+)
+SELECT
+    raw.id, cc.id, st.id, tl.id,
+    s.translation_en, s.confidence_score, s.dialect, s.keywords, s.risk, s.model_name, s.is_reviewed
+FROM staged s
+JOIN raw ON raw.fb_comment_id = s.fb_comment_id
+LEFT JOIN complaint_categories cc ON cc.slug = s.category_slug
+LEFT JOIN sentiment_types st ON st.slug = s.sentiment_slug
+LEFT JOIN threat_levels tl ON tl.slug = s.threat_level_slug
+"""
+
+
+def _to_record(comment: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Convert queued comment to INSERT_COMMENT_WITH_PROCESSING_SQL arguments
+
+    Args:
+        comment: Comment fields as accepted by add_comment_with_processing_async
+
+    Returns:
+        Tuple of statement arguments in parameter order (same order as STAGING_COLUMNS)
+    """
+    return (
+        comment["fb_comment_id"],
+        comment["post_id"],
+        comment.get("author_name"),
+        comment.get("content"),
+        comment.get("parent_comment_id"),
+        comment.get("category_slug"),
+        comment.get("sentiment_slug"),
+        comment.get("threat_level_slug"),
+        comment.get("translation_en"),
+        comment.get("confidence_score"),
+        comment.get("dialect"),
+        comment.get("keywords") or [],
+        comment.get("risk"),
+        comment.get("model_name"),
+        comment.get("is_reviewed", False),
+    )
+
+
+class CommentWriteQueue:
+    """
+    In-memory queue of comments flushed to the database by background consumers
+
+    Requests return as soon as the comment is queued; consumers collect up to
+    batch_size comments (or whatever arrived within flush_interval) and write
+    them in one batch. Queued comments are lost if the process is killed.
+    Comments that still cannot be written after retries are counted in dropped.
+    """
+
+    # Single-row retries after a failed batch: connection/timeout errors are retried
+    # with exponential backoff, rows the database rejects are not
+    ROW_RETRY_ATTEMPTS = 4
+    ROW_RETRY_BASE_DELAY = 0.5
+
+    def __init__(self, pool: Any, maxsize: int = 10_000, batch_size: int = 500,
+                 flush_interval: float = 0.05, consumers: int = 1):
+        """
+        Initialize write queue
+
+        Args:
+            pool: asyncpg connection pool
+            maxsize: Maximum number of queued comments
+            batch_size: Maximum number of comments written per batch
+            flush_interval: Seconds to wait for more comments before writing a batch
+            consumers: Number of background consumer tasks
+        """
+        self.pool = pool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.consumers = consumers
+        self._queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=maxsize)
+        self._tasks: List["asyncio.Task[None]"] = []
+        # Comments that were acknowledged with 202 but never written
+        self.dropped = 0
+
+    def start(self) -> None:
+        """Start background consumer tasks"""
+        for _ in range(self.consumers):
+            self._tasks.append(asyncio.create_task(self._drain_loop()))
+
+    async def stop(self) -> None:
+        """Write all queued comments and stop consumer tasks"""
+        await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def put_nowait(self, comment: Dict[str, Any]) -> None:
+        """
+        Queue comment for writing
+
+        Args:
+            comment: Comment fields as accepted by add_comment_with_processing_async
+
+        Raises:
+            asyncio.QueueFull: If the queue is full (caller should write directly)
+        """
+        self._queue.put_nowait(comment)
+
+    async def _next_batch(self) -> List[Dict[str, Any]]:
+        """Wait for a comment, then collect more until batch_size or flush_interval is reached"""
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _drain_loop(self) -> None:
+        """Consume queued comments in batches until cancelled"""
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Write batch of comments with COPY into a staging table
+
+        If the batch fails (e.g. an unknown post_id), comments are retried
+        one by one so a single bad row does not drop the others.
+
+        Args:
+            batch: Queued comments
+        """
+        records = [_to_record(comment) for comment in batch]
+        try:
+            async with self.pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT_SECONDS) as conn:
+                async with conn.transaction():
+                    await conn.execute(CREATE_STAGING_SQL)
+                    await conn.copy_records_to_table("comment_staging", records=records, columns=STAGING_COLUMNS)
+                    status = await conn.execute(INSERT_FROM_STAGING_SQL)
+            logger.info("Write queue flushed %d comments (%s)", len(records), status)
+            return
+        except Exception as e:
+            logger.warning("Batch write of %d comments failed, retrying one by one: %s", len(records), e)
+
+        for record in records:
+            await self._write_record(record)
+
+    async def _write_record(self, record: Tuple[Any, ...]) -> None:
+        """
+        Write one queued comment, retrying connection and timeout errors with backoff
+
+        Args:
+            record: Statement arguments from _to_record
+        """
+        delay = self.ROW_RETRY_BASE_DELAY
+        for attempt in range(1, self.ROW_RETRY_ATTEMPTS + 1):
+            try:
+                async with self.pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT_SECONDS) as conn:
+                    await conn.execute(INSERT_COMMENT_WITH_PROCESSING_SQL, *record)
+                return
+            except CONNECTION_ERRORS as e:
+                if attempt == self.ROW_RETRY_ATTEMPTS:
+                    self._drop(record, e)
+                    return
+                logger.warning("Database unavailable writing queued comment %s, retrying in %.1fs: %s",
+                               record[0], delay, e)
+                await asyncio.sleep(delay)
+                delay *= 2
+            except Exception as e:
+                self._drop(record, e)
+                return
+
+    def _drop(self, record: Tuple[Any, ...], error: BaseException) -> None:
+        """Count and log a queued comment that could not be written"""
+        self.dropped += 1
+        logger.error("Dropped queued comment %s (%d dropped so far): %s", record[0], self.dropped, error)
+
+
+# Global write queue instance (set during app startup if enabled)
+_write_queue: Optional[CommentWriteQueue] = None
+
+
+def get_write_queue() -> Optional[CommentWriteQueue]:
+    """Get write queue instance, None if write-behind is disabled"""
+    return _write_queue
+
+
+async def init_write_queue(pool: Any) -> CommentWriteQueue:
+    """
+    Create and start write queue
+
+    Args:
+        pool: asyncpg connection pool
+
+    Returns:
+        Started CommentWriteQueue instance
+    """
+    global _write_queue
+
+    _write_queue = CommentWriteQueue(pool)
+    _write_queue.start()
+    return _write_queue
+
+
+async def close_write_queue() -> None:
+    """Write remaining queued comments and stop the queue"""
+    global _write_queue
+
+    if _write_queue is not None:
+        await _write_queue.stop()
+        _write_queue = None
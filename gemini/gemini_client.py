@@ -3,16 +3,23 @@ Google Gemini API Client
 Client for working with Google Gemini API models
 """
 import os
+import asyncio
+import functools
 import logging
-from typing import Optional
+from typing import Any, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
-try:
-    from google import genai
-except ImportError:
-    logger.error("google-genai is not installed. Install it with: pip install google-genai")
-    genai = None
+
+@functools.lru_cache(maxsize=1)
+def _get_genai() -> Optional[Any]:
+    """Import google-genai on first use so importing this module stays cheap"""
+    try:
+        from google import genai
+    except ImportError:
+        logger.error("google-genai is not installed. Install it with: pip install google-genai")
+        return None
+    return genai
 
 
 class GeminiClient:
@@ -43,6 +50,15 @@ class GeminiClient:
         self.default_model = default_model or self.DEFAULT_MODEL
         self.instruction = self.SYSTEM_INSTRUCTION
         
+        genai = _get_genai()
+        
+        # Config is immutable for this client, so build it once instead of per call
+        self._config = None
+        if genai is not None:
+            self._config = genai.types.GenerateContentConfig(
+                system_instruction=self.instruction
+            )
+        
         if not self.api_key:
             logger.error("GEMINI_API_KEY is not set!")
             self.client = None
@@ -53,12 +69,12 @@ class GeminiClient:
             raise ImportError("google-genai is not installed. Install it with: pip install google-genai")
         
         try:
-            logger.info("Creating genai.Client with explicit api_key parameter...")
+            logger.debug("Creating genai.Client with explicit api_key parameter...")
             # Pass API key explicitly via api_key parameter
             self.client = genai.Client(api_key=self.api_key)
-            logger.info(f"Gemini client initialized. Model: {self.default_model}")
+            logger.debug("Gemini client initialized. Model: %s", self.default_model)
         except Exception as e:
-            logger.error(f"Error initializing Gemini client: {e}", exc_info=True)
+            logger.error("Error initializing Gemini client: %s", e, exc_info=True)
             self.client = None
     
     def process_user_request(
@@ -113,17 +129,49 @@ class GeminiClient:
             raise ValueError("Gemini client is not initialized. Check GEMINI_API_KEY.")
         
         model = model or self.default_model
-
-        if genai is None:
-            raise ValueError("google-genai package is not installed")
         
         try:
             response = self.client.models.generate_content(
                 model=model,
                 contents=contents,
-                config=genai.types.GenerateContentConfig(
-                    system_instruction=self.instruction
-                )
+                config=self._config
+            )
+            
+            if response.text is None:
+                raise ValueError("Empty response from Gemini API")
+            
+            return response.text
+            
+        except Exception as e:
+            logger.error("Error generating content: %s", e, exc_info=True)
+            raise
+
+
+    async def agenerate_content(
+        self,
+        contents: str,
+        model: Optional[str] = None
+    ) -> str:
+        """
+        Generate content via Gemini API without blocking the event loop
+        
+        Args:
+            contents: Request text
+            model: Model name (if not provided, uses default_model)
+        
+        Returns:
+            Model response as a string
+        """
+        if not self.client:
+            raise ValueError("Gemini client is not initialized. Check GEMINI_API_KEY.")
+        
+        model = model or self.default_model
+        
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=model,
+                contents=contents,
+                config=self._config
             )
             
             if response.text is None:
@@ -132,9 +180,35 @@ class GeminiClient:
             return response.text
             
         except Exception as e:
-            logger.error(f"Error generating content: {e}", exc_info=True)
+            logger.error("Error generating content: %s", e, exc_info=True)
             raise
 
+    async def process_user_requests_batch(
+        self,
+        prompts: List[str],
+        concurrency: int = 8,
+        return_exceptions: bool = False
+    ) -> List[Union[str, BaseException]]:
+        """
+        Process several user requests concurrently
+        
+        Args:
+            prompts: List of user prompts
+            concurrency: Maximum number of requests in flight (keeps clear of rate limits)
+            return_exceptions: If True, a failed prompt yields its exception in place of
+                a response instead of discarding the whole batch
+        
+        Returns:
+            List of model responses (or exceptions) in the same order as prompts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate_content(prompt)
+        
+        return await asyncio.gather(*[run(p) for p in prompts], return_exceptions=return_exceptions)
+
 
     def is_available(self) -> bool:
         """
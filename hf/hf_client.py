@@ -3,16 +3,168 @@ Hugging Face API Client
 Client for working with Hugging Face Inference API models
 """
 import os
+import time
+import random
+import asyncio
+import functools
+import hashlib
 import logging
-from typing import Optional
+import threading
+import orjson
+from cachetools import TTLCache
+from typing import Any, Dict, Generator, List, Optional, Tuple
+from .semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
-try:
-    from huggingface_hub import InferenceClient
-except ImportError:
-    logger.error("huggingface_hub is not installed. Install it with: pip install huggingface_hub")
-    InferenceClient = None
+
+@functools.lru_cache(maxsize=1)
+def _get_inference_client_classes() -> Optional[Tuple[Any, Any]]:
+    """
+    Import huggingface_hub on first use so importing this module stays cheap
+    
+    Returns:
+        Tuple of (InferenceClient, AsyncInferenceClient), None if huggingface_hub is not installed
+    """
+    try:
+        from huggingface_hub import AsyncInferenceClient, InferenceClient
+    except ImportError:
+        logger.error("huggingface_hub is not installed. Install it with: pip install huggingface_hub")
+        return None
+    return InferenceClient, AsyncInferenceClient
+
+
+@functools.lru_cache(maxsize=1)
+def _get_httpx() -> Optional[Any]:
+    """Import httpx on first use, None if it is not installed"""
+    try:
+        import httpx
+    except ImportError:
+        logger.warning("httpx is not installed, falling back to InferenceClient. Install it with: pip install httpx")
+        return None
+    return httpx
+
+
+# Inference clients shared by all HFClient instances, keyed by (client class, api_key),
+# so every instance reuses the same HTTP session and keep-alive connections.
+# The lock makes check-and-create safe when clients are built from worker threads.
+_CLIENT_CACHE: Dict[Tuple[str, str], Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+# Upstream statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Upstream statuses meaning the token is invalid or lacks access
+AUTH_ERROR_STATUS_CODES = frozenset({401, 403})
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """Get HTTP status code of a failed API call, None if the error has no response"""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Check if an API error is transient and the request can be retried
+    
+    Args:
+        error: Exception raised by the inference client
+    
+    Returns:
+        True for rate limits, 5xx responses, timeouts and connection errors
+    """
+    status_code = _status_code(error)
+    if status_code is not None:
+        return status_code in RETRYABLE_STATUS_CODES
+    # requests/aiohttp connection and timeout errors derive from OSError
+    if isinstance(error, (OSError, TimeoutError)):
+        return True
+    httpx = _get_httpx()
+    return httpx is not None and isinstance(error, httpx.TransportError)
+
+
+# Tokenizer used to measure prompt length for small-model routing
+ROUTING_TOKENIZER = "Qwen/Qwen2.5-7B-Instruct"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tokenizer() -> Optional[Any]:
+    """Load routing tokenizer once, None if tokenizers is unavailable"""
+    try:
+        from tokenizers import Tokenizer
+        return Tokenizer.from_pretrained(ROUTING_TOKENIZER)
+    except Exception as e:
+        logger.warning("Routing tokenizer is not available, counting words instead: %s", e)
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_tokens(text: str) -> int:
+    """
+    Count prompt tokens locally
+    
+    Args:
+        text: Prompt text
+    
+    Returns:
+        Number of tokens (number of words if tokenizer is unavailable)
+    """
+    tokenizer = _get_tokenizer()
+    if tokenizer is None:
+        return len(text.split())
+    return len(tokenizer.encode(text).ids)
+
+
+def _get_shared_client(client_cls: Any, api_key: str) -> Any:
+    """
+    Get shared inference client for an API key, creating it on first use
+    
+    Args:
+        client_cls: InferenceClient or AsyncInferenceClient
+        api_key: API key for HF
+    
+    Returns:
+        Client instance shared across HFClient instances
+    """
+    key = (client_cls.__name__, api_key)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = client_cls(api_key=api_key)
+            _CLIENT_CACHE[key] = client
+        return client
+
+
+def _get_http_session(api_key: str) -> Optional[Any]:
+    """
+    Get shared raw HTTP session for an API key, creating it on first use
+    
+    Args:
+        api_key: API key for HF
+    
+    Returns:
+        httpx.Client with auth header and connection pool, None if httpx is unavailable
+    """
+    httpx = _get_httpx()
+    if httpx is None:
+        return None
+    
+    key = ("httpx.Client", api_key)
+    with _CLIENT_CACHE_LOCK:
+        session = _CLIENT_CACHE.get(key)
+        if session is None:
+            session = httpx.Client(
+                http2=True,
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                },
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
+            _CLIENT_CACHE[key] = session
+        return session
 
 
 class HFClient:
@@ -31,36 +183,128 @@ class HFClient:
         "Keep answer in JSON format with: somali_text, english_text, risk_category, risk_level."
     )
     
-    def __init__(self, api_key: Optional[str] = None, default_model: Optional[str] = None):
+    # OpenAI-compatible chat endpoint used by the raw HTTP path
+    CHAT_COMPLETIONS_URL = "https://router.huggingface.co/v1/chat/completions"
+    
+    # Retry policy for transient API errors
+    MAX_ATTEMPTS = 3
+    RETRY_INITIAL_DELAY = 0.5
+    RETRY_MAX_DELAY = 5.0
+    
+    # Circuit breaker: fast-fail for a while after consecutive transient failures
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_COOLDOWN_SECONDS = 30.0
+    
+    # Prompts shorter than this are routed to small_model when it is set
+    SMALL_PROMPT_TOKENS = 32
+    
+    # Exact-match response cache bounds: stale answers expire, cold ones are evicted
+    CACHE_MAX_ENTRIES = 10_000
+    CACHE_TTL_SECONDS = 3600
+    
+    def __init__(self, api_key: Optional[str] = None, default_model: Optional[str] = None,
+                 semantic_cache_threshold: Optional[float] = None,
+                 small_model: Optional[str] = None,
+                 cache_max_entries: Optional[int] = None,
+                 cache_ttl_seconds: Optional[float] = None):
         """
         Initialize HF client
         
         Args:
             api_key: API key for HF (if not provided, taken from HF_TOKEN env var)
             default_model: Default model name (if not provided, uses DEFAULT_MODEL constant)
+            semantic_cache_threshold: Cosine similarity for semantic cache hits (disabled if not provided)
+            small_model: Cheaper model for short prompts (routing disabled if not provided)
+            cache_max_entries: Response cache size, 0 disables it (if not provided, uses CACHE_MAX_ENTRIES constant)
+            cache_ttl_seconds: Response cache TTL (if not provided, uses CACHE_TTL_SECONDS constant)
         """
         # Get API key: first from parameter, then from environment variable
         self.api_key = api_key or os.getenv("HF_TOKEN")
         self.default_model = default_model or self.DEFAULT_MODEL
+        self.small_model = small_model
         self.instruction = self.SYSTEM_INSTRUCTION
+        # System message is identical for every request and never mutated by the client
+        self._system_message = {"role": "system", "content": self.instruction}
+        
+        # Exact-match response cache: repeated prompts skip the API round-trip.
+        # TTLCache is not thread-safe and sync requests may run in worker threads.
+        self._cache: "TTLCache[bytes, str]" = TTLCache(
+            maxsize=self.CACHE_MAX_ENTRIES if cache_max_entries is None else cache_max_entries,
+            ttl=self.CACHE_TTL_SECONDS if cache_ttl_seconds is None else cache_ttl_seconds
+        )
+        self._cache_lock = threading.Lock()
+        # Requests currently awaiting the API, keyed like the response cache
+        self._inflight: Dict[bytes, "asyncio.Task[str]"] = {}
+        
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
+        
+        # Optional semantic cache: paraphrased prompts reuse earlier responses
+        self._semantic_cache: Optional[SemanticCache] = None
+        if semantic_cache_threshold is not None:
+            semantic_cache = SemanticCache(threshold=semantic_cache_threshold)
+            if semantic_cache.is_available():
+                self._semantic_cache = semantic_cache
+        
+        # Clients are created on first use, so unused instances hold no connection pools
+        self._client: Optional[Any] = None
+        self._async_client: Optional[Any] = None
+        self._http_session: Optional[Any] = None
+        
+        # Memoized is_available() result, cleared when the API rejects the token
+        self._available = False
         
         if not self.api_key:
             logger.error("HF_TOKEN is not set!")
-            self.client = None
             return
         
-        if InferenceClient is None:
-            logger.error("huggingface_hub is not installed. Install it with: pip install huggingface_hub")
+        if _get_inference_client_classes() is None:
             raise ImportError("huggingface_hub is not installed. Install it with: pip install huggingface_hub")
+        self._available = True
+    
+    def _create_client(self, index: int) -> Optional[Any]:
+        """
+        Create (or reuse) shared inference client
         
+        Args:
+            index: 0 for InferenceClient, 1 for AsyncInferenceClient
+        
+        Returns:
+            Client instance, None if HF_TOKEN is missing or initialization failed
+        """
+        client_classes = _get_inference_client_classes()
+        if not self.api_key or client_classes is None:
+            return None
         try:
-            logger.info("Creating InferenceClient with explicit api_key parameter...")
             # Pass API key explicitly via api_key parameter
-            self.client = InferenceClient(api_key=self.api_key)
-            logger.info(f"HF client initialized. Model: {self.default_model}")
+            client = _get_shared_client(client_classes[index], self.api_key)
+            logger.info("HF client initialized. Model: %s", self.default_model)
+            return client
         except Exception as e:
-            logger.error(f"Error initializing HF client: {e}", exc_info=True)
-            self.client = None
+            logger.error("Error initializing HF client: %s", e, exc_info=True)
+            return None
+    
+    @property
+    def client(self) -> Optional[Any]:
+        """Sync InferenceClient, created on first access"""
+        if self._client is None:
+            self._client = self._create_client(0)
+        return self._client
+    
+    @property
+    def async_client(self) -> Optional[Any]:
+        """Async InferenceClient with its own pooled session, created on first access"""
+        if self._async_client is None:
+            self._async_client = self._create_client(1)
+        return self._async_client
+    
+    @property
+    def http_session(self) -> Optional[Any]:
+        """Raw HTTP session for sync requests, created on first access"""
+        if self._http_session is None and self.api_key:
+            # Sync requests go straight over HTTP, skipping InferenceClient's per-call wrapping
+            self._http_session = _get_http_session(self.api_key)
+        return self._http_session
     
     def process_user_request(
         self,
@@ -75,23 +319,294 @@ class HFClient:
         
         Args:
             user_prompt: User's input prompt
-            model: Model name (if not provided, uses default_model)
+            model: Model name (if not provided, uses default_model or small_model for short prompts)
         
         Returns:
             Model response as a string
         """
-        if not self.client:
+        if not self._available:
             raise ValueError("HF client is not initialized. Check HF_TOKEN.")
         
         # The system instruction is sent as a system message
         # User prompt is sent as user message
         response = self.generate_content(
             contents=user_prompt,
-            model=model
+            model=model or self._route_model(user_prompt)
         )
         
         return response
     
+    async def aprocess_user_request(
+        self,
+        user_prompt: str,
+        model: Optional[str] = None
+    ) -> str:
+        """
+        Process user request without blocking the event loop
+        
+        Args:
+            user_prompt: User's input prompt
+            model: Model name (if not provided, uses default_model or small_model for short prompts)
+        
+        Returns:
+            Model response as a string
+        """
+        if not self._available:
+            raise ValueError("HF client is not initialized. Check HF_TOKEN.")
+        
+        return await self.agenerate_content(
+            contents=user_prompt,
+            model=model or self._route_model(user_prompt)
+        )
+    
+    def _route_model(self, user_prompt: str) -> str:
+        """
+        Pick model for a prompt: short prompts go to small_model when configured
+        
+        Args:
+            user_prompt: User's input prompt
+        
+        Returns:
+            Model name
+        """
+        if self.small_model and _count_tokens(user_prompt) < self.SMALL_PROMPT_TOKENS:
+            return self.small_model
+        return self.default_model
+    
+
+    def process_user_request_json(
+        self,
+        user_prompt: str,
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Process user request in structured-output mode and parse the JSON answer
+        
+        Args:
+            user_prompt: User's input prompt
+            model: Model name (if not provided, uses default_model)
+        
+        Returns:
+            Parsed JSON object from the model response
+        """
+        if not self._available:
+            raise ValueError("HF client is not initialized. Check HF_TOKEN.")
+        
+        # Ask the provider for guided JSON decoding so no repair parsing is needed
+        response = self.generate_content(
+            contents=user_prompt,
+            model=model,
+            response_format={"type": "json_object"}
+        )
+        
+        return orjson.loads(response)
+
+    def _cache_key(self, contents: str, model: str, kwargs: Dict[str, Any]) -> bytes:
+        """
+        Build response cache key for a request
+        
+        Whitespace in the prompt is collapsed so trivial variants share an entry.
+        
+        Args:
+            contents: Request text
+            model: Model name
+            kwargs: Additional parameters for API
+        
+        Returns:
+            SHA-256 digest identifying the request
+        """
+        normalized = " ".join(contents.split())
+        raw = f"{model}|{self.instruction}|{normalized}|{sorted(kwargs.items())}"
+        return hashlib.sha256(raw.encode("utf-8")).digest()
+
+    def _cache_lookup(
+        self,
+        contents: str,
+        model: str,
+        kwargs: Dict[str, Any]
+    ) -> Tuple[bytes, Optional[Any], Optional[str]]:
+        """
+        Look up a request in the exact-match and semantic caches
+        
+        Args:
+            contents: Request text
+            model: Model name
+            kwargs: Additional parameters for API
+        
+        Returns:
+            Tuple of (cache key, prompt embedding or None, cached response or None)
+        """
+        cache_key = self._cache_key(contents, model, kwargs)
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cache_key, None, cached
+        
+        vector = None
+        if self._use_semantic_cache(kwargs):
+            vector, cached = self._semantic_lookup(cache_key, contents, model)
+        return cache_key, vector, cached
+
+    def _use_semantic_cache(self, kwargs: Dict[str, Any]) -> bool:
+        """Semantic lookup only applies to plain requests, extra parameters may change the output format"""
+        return self._semantic_cache is not None and not kwargs
+
+    def _semantic_lookup(self, cache_key: bytes, contents: str, model: str) -> Tuple[Any, Optional[str]]:
+        """
+        Embed a request and look it up in the semantic cache
+        
+        CPU-bound (model forward pass): async callers run it in a worker thread.
+        
+        Args:
+            cache_key: Exact-match cache key of the request, filled on a hit
+            contents: Request text
+            model: Model name, only its own answers are reused
+        
+        Returns:
+            Tuple of (prompt embedding, cached response or None)
+        """
+        vector = self._semantic_cache.embed(contents)
+        cached = self._semantic_cache.search(vector, model)
+        if cached is not None and self._cache.maxsize:
+            with self._cache_lock:
+                self._cache[cache_key] = cached
+        return vector, cached
+
+    def _cache_store(self, cache_key: bytes, vector: Optional[Any], model: str, content: str) -> None:
+        """
+        Store a fresh response in the caches
+        
+        Args:
+            cache_key: Key returned by _cache_lookup
+            vector: Prompt embedding returned by _cache_lookup
+            model: Model name that produced the response
+            content: Model response
+        """
+        # maxsize 0 disables the exact-match cache (TTLCache rejects any insert then)
+        if self._cache.maxsize:
+            with self._cache_lock:
+                self._cache[cache_key] = content
+        if vector is not None:
+            self._semantic_cache.add(vector, model, content)
+
+    def _build_messages(self, contents: str) -> List[Dict[str, str]]:
+        """
+        Build chat messages for a request
+        
+        Args:
+            contents: Request text
+        
+        Returns:
+            List with system instruction and user message
+        """
+        return [self._system_message, {"role": "user", "content": contents}]
+
+    @staticmethod
+    def _extract_content(response: Any) -> str:
+        """
+        Extract text from chat completion response
+        
+        Args:
+            response: Chat completion response
+        
+        Returns:
+            Message content
+        """
+        choices = response.choices
+        if not choices:
+            raise ValueError("Empty response from HF API")
+        
+        message = choices[0].message
+        content = message.content if message else None
+        if not content:
+            raise ValueError("Empty response content from HF API")
+        
+        return content
+
+    def _post_chat_completion(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        kwargs: Dict[str, Any]
+    ) -> str:
+        """
+        Send chat completion request as a raw HTTP POST
+        
+        Args:
+            model: Model name
+            messages: Chat messages built for the request
+            kwargs: Additional parameters for API
+        
+        Returns:
+            Message content
+        """
+        body = orjson.dumps({"model": model, "messages": messages, **kwargs})
+        response = self.http_session.post(self.CHAT_COMPLETIONS_URL, content=body)
+        response.raise_for_status()
+        
+        choices = orjson.loads(response.content).get("choices")
+        if not choices:
+            raise ValueError("Empty response from HF API")
+        
+        content = (choices[0].get("message") or {}).get("content")
+        if not content:
+            raise ValueError("Empty response content from HF API")
+        
+        return content
+
+    def _check_circuit(self) -> None:
+        """Fast-fail while the circuit breaker is open"""
+        if time.monotonic() < self._circuit_open_until:
+            raise RuntimeError("HF API is unavailable after repeated failures, retry later")
+
+    def _record_success(self) -> None:
+        """Reset circuit breaker failure counter"""
+        self._consecutive_failures = 0
+
+    def _record_failure(self) -> None:
+        """Count a transient failure and open the circuit breaker at the threshold"""
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.CIRCUIT_FAILURE_THRESHOLD:
+            self._circuit_open_until = time.monotonic() + self.CIRCUIT_COOLDOWN_SECONDS
+            self._consecutive_failures = 0
+            logger.warning("HF API circuit opened for %.0fs", self.CIRCUIT_COOLDOWN_SECONDS)
+
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with jitter
+        
+        Args:
+            attempt: Number of the failed attempt (starting from 1)
+        
+        Returns:
+            Delay in seconds before the next attempt
+        """
+        delay = min(self.RETRY_MAX_DELAY, self.RETRY_INITIAL_DELAY * 2 ** (attempt - 1))
+        return delay + random.uniform(0, self.RETRY_INITIAL_DELAY)
+
+    def _should_retry(self, error: Exception, attempt: int) -> bool:
+        """
+        Decide whether a failed attempt is retried, recording final transient failures
+        
+        An authentication error marks the client unavailable.
+        
+        Args:
+            error: Exception raised by the inference client
+            attempt: Number of the failed attempt (starting from 1)
+        
+        Returns:
+            True if the request should be attempted again
+        """
+        if not _is_retryable(error):
+            if _status_code(error) in AUTH_ERROR_STATUS_CODES:
+                logger.error("HF API rejected HF_TOKEN, marking client unavailable")
+                self._available = False
+            return False
+        if attempt < self.MAX_ATTEMPTS:
+            logger.debug("Retrying HF request after attempt %d: %s", attempt, error)
+            return True
+        self._record_failure()
+        return False
 
     def generate_content(
         self,
@@ -110,53 +625,321 @@ class HFClient:
         Returns:
             Model response as a string
         """
-        if not self.client:
+        if not self._available:
             raise ValueError("HF client is not initialized. Check HF_TOKEN.")
         
         model = model or self.default_model
+        
+        cache_key, vector, cached = self._cache_lookup(contents, model, kwargs)
+        if cached is not None:
+            return cached
+        
+        # InferenceClient is only created as a fallback when httpx is unavailable
+        if self.http_session is None and self.client is None:
+            raise ValueError("HF client is not initialized. Check HF_TOKEN.")
+        
+        self._check_circuit()
+        messages = self._build_messages(contents)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if self.http_session is not None:
+                    content = self._post_chat_completion(model, messages, kwargs)
+                else:
+                    # HF Inference API uses chat.completions.create with messages
+                    response = self.client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        **kwargs
+                    )
+                    content = self._extract_content(response)
+            except Exception as e:
+                if self._should_retry(e, attempt):
+                    time.sleep(self._retry_delay(attempt))
+                    continue
+                logger.error("Error generating content: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+                raise
+            
+            self._record_success()
+            self._cache_store(cache_key, vector, model, content)
+            return content
 
-        if InferenceClient is None:
-            raise ValueError("huggingface_hub package is not installed")
+    async def agenerate_content(
+        self,
+        contents: str,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> str:
+        """
+        Generate content via HF Inference API without blocking the event loop
         
+        Concurrent identical requests share a single API call.
+        
+        Args:
+            contents: Request text
+            model: Model name (if not provided, uses default_model)
+            **kwargs: Additional parameters for API
+        
+        Returns:
+            Model response as a string
+        """
+        if not self._available:
+            raise ValueError("HF client is not initialized. Check HF_TOKEN.")
+        
+        model = model or self.default_model
+        
+        cache_key = self._cache_key(contents, model, kwargs)
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        vector = None
+        if self._use_semantic_cache(kwargs):
+            # Embedding is a model forward pass, keep it off the event loop
+            vector, cached = await asyncio.to_thread(self._semantic_lookup, cache_key, contents, model)
+            if cached is not None:
+                return cached
+        
+        # Check-and-set below has no await in between, so it is atomic on the event loop.
+        # The API call runs in its own task and every caller shields it, so a cancelled
+        # caller (e.g. client disconnect) does not cancel the request others are awaiting.
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._agenerate_shared(cache_key, vector, model, contents, kwargs))
+            # Retrieve the error so asyncio does not warn when every caller was cancelled
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[cache_key] = task
+        return await asyncio.shield(task)
+
+    async def _agenerate_shared(
+        self,
+        cache_key: bytes,
+        vector: Optional[Any],
+        model: str,
+        contents: str,
+        kwargs: Dict[str, Any]
+    ) -> str:
+        """
+        Call HF Inference API for all callers awaiting cache_key and cache the response
+        
+        Args:
+            cache_key: Response cache key of the request
+            vector: Prompt embedding for the semantic cache, None if it is not used
+            model: Model name
+            contents: Request text
+            kwargs: Additional parameters for API
+        
+        Returns:
+            Model response as a string
+        """
         try:
-            # HF Inference API uses chat.completions.create with messages
-            messages = [
-                {
-                    "role": "system",
-                    "content": self.instruction
-                },
-                {
-                    "role": "user",
-                    "content": contents
-                }
-            ]
-            
-            response = self.client.chat.completions.create(
-                model=model,
-                messages=messages,
-                **kwargs
-            )
-            
-            # Extract text from response
-            if not response.choices or len(response.choices) == 0:
-                raise ValueError("Empty response from HF API")
-            
-            message = response.choices[0].message
-            if not message or not message.content:
-                raise ValueError("Empty response content from HF API")
-            
-            return message.content
+            content = await self._agenerate_uncached(model, self._build_messages(contents), kwargs)
+        finally:
+            self._inflight.pop(cache_key, None)
+        
+        self._cache_store(cache_key, vector, model, content)
+        return content
+
+    async def _agenerate_uncached(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        kwargs: Dict[str, Any]
+    ) -> str:
+        """
+        Call HF Inference API asynchronously with retries, bypassing caches
+        
+        Args:
+            model: Model name
+            messages: Chat messages built for the request
+            kwargs: Additional parameters for API
+        
+        Returns:
+            Model response as a string
+        """
+        self._check_circuit()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self.async_client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    **kwargs
+                )
+                content = self._extract_content(response)
+            except Exception as e:
+                if self._should_retry(e, attempt):
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+                logger.error("Error generating content: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+                raise
             
-        except Exception as e:
-            logger.error(f"Error generating content: {e}", exc_info=True)
-            raise
+            self._record_success()
+            return content
+
+    def stream_content(
+        self,
+        contents: str,
+        model: Optional[str] = None,
+        **kwargs
+    ) -> Generator[str, None, None]:
+        """
+        Stream generated text as it arrives from HF Inference API
+        
+        Closing the returned generator closes the underlying HTTP stream.
+        
+        Args:
+            contents: Request text
+            model: Model name (if not provided, uses default_model)
+            **kwargs: Additional parameters for API
+        
+        Yields:
+            Text deltas in generation order
+        """
+        if not self.client:
+            raise ValueError("HF client is not initialized. Check HF_TOKEN.")
+        
+        stream = self.client.chat.completions.create(
+            model=model or self.default_model,
+            messages=self._build_messages(contents),
+            stream=True,
+            **kwargs
+        )
+        
+        try:
+            for chunk in stream:
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        yield delta
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
+    def stream_json(
+        self,
+        user_prompt: str,
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Stream a JSON answer and stop as soon as a complete object is received
+        
+        Args:
+            user_prompt: User's input prompt
+            model: Model name (if not provided, uses default_model)
+        
+        Returns:
+            Parsed JSON object from the model response
+        """
+        buffer = ""
+        stream = self.stream_content(user_prompt, model=model)
+        try:
+            for delta in stream:
+                buffer += delta
+                if "}" not in delta:
+                    continue
+                start = buffer.find("{")
+                end = buffer.rfind("}")
+                if start == -1:
+                    continue
+                try:
+                    return orjson.loads(buffer[start:end + 1])
+                except orjson.JSONDecodeError:
+                    # Closing brace of a nested object, keep reading
+                    continue
+        finally:
+            stream.close()
+        
+        raise ValueError("No complete JSON object in HF API response")
+
+    async def abatch(
+        self,
+        prompts: List[str],
+        model: Optional[str] = None,
+        concurrency: int = 8
+    ) -> List[str]:
+        """
+        Process several prompts concurrently
+        
+        Requests overlap in flight, which is how providers with server-side
+        continuous batching (vLLM/TGI backends) batch them - the chat API
+        itself has no list-of-prompts form.
+        
+        Args:
+            prompts: List of request texts
+            model: Model name (if not provided, uses default_model)
+            concurrency: Maximum number of requests in flight (keeps clear of rate limits)
+        
+        Returns:
+            List of model responses in the same order as prompts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate_content(prompt, model=model)
+        
+        return await asyncio.gather(*[run(p) for p in prompts])
+
+    async def prefetch(
+        self,
+        prompts: List[str],
+        model: Optional[str] = None,
+        concurrency: int = 2
+    ) -> None:
+        """
+        Warm the response caches with prompts that are likely to be asked next
+
+        Results are not returned, failures are logged and ignored. Concurrency is
+        kept low so prefetching does not compete with user requests for rate limits.
+
+        Args:
+            prompts: List of predicted request texts
+            model: Model name (if not provided, uses default_model)
+            concurrency: Maximum number of prefetch requests in flight
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(prompt: str) -> None:
+            async with semaphore:
+                try:
+                    await self.agenerate_content(prompt, model=model)
+                except Exception as e:
+                    logger.debug("Prefetch failed: %s", e)
+
+        await asyncio.gather(*[run(p) for p in prompts])
+
+    def batch_process(
+        self,
+        prompts: List[str],
+        model: Optional[str] = None,
+        concurrency: int = 8
+    ) -> List[str]:
+        """
+        Synchronous wrapper around abatch for scripts without an event loop
+        
+        Args:
+            prompts: List of request texts
+            model: Model name (if not provided, uses default_model)
+            concurrency: Maximum number of requests in flight
+        
+        Returns:
+            List of model responses in the same order as prompts
+        """
+        return asyncio.run(self.abatch(prompts, model=model, concurrency=concurrency))
 
 
     def is_available(self) -> bool:
         """
         Check if client is available
         
+        Does not create the underlying clients.
+        
         Returns:
             True if client is available, False otherwise
         """
-        return self.client is not None and self.api_key is not None
+        return self._available
@@ -0,0 +1,127 @@
+"""
+Semantic Response Cache
+Embedding-similarity cache for AI model responses
+"""
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache of model responses keyed by prompt embeddings
+
+    Prompts are embedded locally and compared by cosine similarity, so
+    paraphrases of an already answered prompt are served from memory.
+    Entries are tagged with the model that produced them and only match
+    lookups for the same model.
+    """
+
+    # Default local embedding model (384-dim vectors)
+    DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 10_000,
+                 embedding_model: Optional[str] = None):
+        """
+        Initialize semantic cache
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached responses (oldest are overwritten)
+            embedding_model: Embedding model name (if not provided, uses DEFAULT_EMBEDDING_MODEL)
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._model = None
+        self._np: Optional[Any] = None
+        self._vectors: Optional[Any] = None
+        self._model_ids: Optional[Any] = None
+        self._model_index: Dict[str, int] = {}
+        self._responses: List[Optional[str]] = [None] * max_entries
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+        # Imported here, not at module level: sentence-transformers pulls in torch,
+        # which only deployments that enable the semantic cache should pay for
+        try:
+            import numpy as np
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            logger.error("sentence-transformers is not installed. Install it with: pip install sentence-transformers")
+            return
+
+        self._np = np
+        try:
+            self._model = SentenceTransformer(embedding_model or self.DEFAULT_EMBEDDING_MODEL)
+        except Exception as e:
+            logger.error("Error loading embedding model: %s", e)
+            self._model = None
+
+    def is_available(self) -> bool:
+        """
+        Check if cache is available
+
+        Returns:
+            True if embedding model is loaded, False otherwise
+        """
+        return self._model is not None
+
+    def embed(self, text: str) -> Any:
+        """
+        Embed text into a unit-length vector
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Normalized float32 embedding vector
+        """
+        vector = self._model.encode([text], normalize_embeddings=True)[0]
+        return vector.astype(self._np.float32, copy=False)
+
+    def search(self, vector: Any, model: str) -> Optional[str]:
+        """
+        Find cached response for the most similar prompt answered by the same model
+
+        Args:
+            vector: Embedding returned by embed()
+            model: Model name the response must come from
+
+        Returns:
+            Cached response if similarity reaches threshold, None otherwise
+        """
+        np = self._np
+        with self._lock:
+            model_id = self._model_index.get(model)
+            if self._size == 0 or model_id is None:
+                return None
+            scores = self._vectors[:self._size] @ vector
+            scores[self._model_ids[:self._size] != model_id] = -np.inf
+            best = int(np.argmax(scores))
+            if scores[best] >= self.threshold:
+                return self._responses[best]
+        return None
+
+    def add(self, vector: Any, model: str, response: str) -> None:
+        """
+        Store response for an embedded prompt
+
+        Args:
+            vector: Embedding returned by embed()
+            model: Model name that produced the response
+            response: Model response to cache
+        """
+        np = self._np
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+                self._model_ids = np.full(self.max_entries, -1, dtype=np.int32)
+            model_id = self._model_index.setdefault(model, len(self._model_index))
+            self._vectors[self._next] = vector
+            self._model_ids[self._next] = model_id
+            self._responses[self._next] = response
+            self._next = (self._next + 1) % self.max_entries
+            self._size = min(self._size + 1, self.max_entries)
@@ -3,31 +3,85 @@ FastAPI application for processing scraped data
 Simplified version without ChromaDB dependencies
 """
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import JSONResponse, HTMLResponse
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from fastapi.exceptions import RequestValidationError
+from fastapi.staticfiles import StaticFiles
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Optional, Dict, Any, List, Union, TYPE_CHECKING
+import asyncio
 import logging
 import sys
 import os
 import json
+import gzip
+import hashlib
+import functools
+import orjson
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
 from dotenv import load_dotenv
+from cachetools import TTLCache
 # from gemini.gemini_client import GeminiClient
-from hf.hf_client import HFClient
-from database.model_parser import ModelParser
-from database.database import init_database, get_database
-from database.database_api import add_raw_comment, add_processed_comment
-from database.models import SaveProcessedCommentRequest
-from comments import router as comments_router
+from database.database import init_database, get_database, DatabaseUnavailableError
+from database.database_api import add_raw_comment, add_processed_comment, add_comment_with_processing_async
+from database.models import SaveProcessedCommentRequest, SaveProcessedCommentResponse
+from database.write_queue import init_write_queue, close_write_queue, get_write_queue
+from comments import accepted_encodings, router as comments_router
+
+if TYPE_CHECKING:
+    # HF client and parser pull in heavy dependencies, they are imported on first use
+    from hf.hf_client import HFClient
+    from database.model_parser import ModelParser
+
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None  # type: ignore
 
 # Load environment variables from .env file
 load_dotenv()
 
 
-# Configure logging - INFO level (suppress DEBUG logs from uvicorn/httptools)
+@dataclass(frozen=True)
+class Settings:
+    """Application settings read from environment variables once"""
+    hf_token: Optional[str]
+    hf_semantic_cache_threshold: Optional[float]
+    comment_write_behind: bool
+    save_dedup_max_entries: int
+    save_dedup_ttl_seconds: float
+    hf_cache_max_entries: int
+    hf_cache_ttl_seconds: float
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get application settings, parsing environment variables on first call
+    
+    Returns:
+        Frozen Settings instance
+    """
+    semantic_cache_threshold = os.getenv("HF_SEMANTIC_CACHE_THRESHOLD")
+    return Settings(
+        hf_token=os.getenv("HF_TOKEN"),
+        hf_semantic_cache_threshold=float(semantic_cache_threshold) if semantic_cache_threshold else None,
+        comment_write_behind=os.getenv("COMMENT_WRITE_BEHIND", "").lower() in ("1", "true", "yes"),
+        save_dedup_max_entries=int(os.getenv("SAVE_DEDUP_MAX_ENTRIES", "100000")),
+        save_dedup_ttl_seconds=float(os.getenv("SAVE_DEDUP_TTL_SECONDS", "300")),
+        hf_cache_max_entries=int(os.getenv("HF_CACHE_MAX_ENTRIES", "10000")),
+        hf_cache_ttl_seconds=float(os.getenv("HF_CACHE_TTL_SECONDS", "3600")),
+    )
+
+
+# Configure logging - LOG_LEVEL env (default INFO; suppresses DEBUG logs from uvicorn/httptools)
 # Explicitly set output to stderr (terminal)
 logging.basicConfig(
-    level=logging.INFO,
+    level=getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     stream=sys.stderr,
     force=True  # Переопределяем существующую конфигурацию
@@ -35,36 +89,144 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize database connection on application startup"""
+    # Confirms uvicorn picked uvloop (expected: "Loop"), not the stdlib loop ("_UnixSelectorEventLoop")
+    logger.info("Event loop: %s", type(asyncio.get_running_loop()).__name__)
+    try:
+        # init_database() is synchronous and automatically initializes Supabase client
+        db = init_database()
+        # asyncpg pool for non-blocking writes (only if DATABASE_URL is set)
+        await db.init_pool()
+        # Optional write-behind: /hf/save queues comments and returns before they are written
+        if get_settings().comment_write_behind and db.pool is not None:
+            await init_write_queue(db.pool)
+        logger.info("Database initialized successfully")
+        
+    except Exception as e:
+        logger.error("Failed to initialize database: %s", e)
+        raise
+    
+    # Semantic cache loads an embedding model at construction: do it before serving,
+    # in a worker thread, instead of on the event loop during the first /hf/chat request
+    if get_settings().hf_semantic_cache_threshold is not None:
+        try:
+            app.state.hf_client = await asyncio.to_thread(_create_hf_client)
+        except Exception as e:
+            logger.warning("Failed to initialize HF client at startup: %s", e)
+    
+    yield
+    
+    await close_write_queue()
+    await db.close_pool()
+
+
 app = FastAPI(
     title="Gaado Backend API",
     description="API for processing scraped data (simplified version)",
     version="1.0.0",
     docs_url=None,
-    redoc_url=None
+    redoc_url=None,
+    # orjson serializes response dicts straight to bytes, faster than stdlib json
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 
+# Health check response, built once
+HEALTH_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [(b"content-type", b"application/json"), (b"content-length", b"15")],
+}
+HEALTH_BODY = {"type": "http.response.body", "body": b'{"status":"ok"}'}
+
+
+class HealthCheckMiddleware:
+    """ASGI middleware answering /health before routing, for frequent load balancer probes"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/health":
+            await send(HEALTH_START)
+            await send(HEALTH_BODY)
+            return
+        await self.app(scope, receive, send)
+
+
+# Middleware added later wraps this one, so keep this call after any other add_middleware
+app.add_middleware(HealthCheckMiddleware)
+
+
+# Static assets directory (landing page, scripts, styles)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache versioned (?v=<hash>) assets for good"""
+    
+    async def get_response(self, path: str, scope) -> Any:
+        """Serve static file, marking versioned assets as immutable"""
+        response = await super().get_response(path, scope)
+        if response.status_code == 200 and b"v=" in scope.get("query_string", b""):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 
 # Include routers
 app.include_router(comments_router)
+# Static assets are served from files, not held in Python strings
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
 
-# Initialize database on startup
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database connection on application startup"""
-    try:
-        # init_database() is synchronous and automatically connects via psycopg2 and initializes Supabase client
-        init_database()
-        logger.info("Database initialized successfully")
-        
-    except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
-        raise
+
+def get_hf_client() -> "HFClient":
+    """
+    Get shared HF client, importing and creating it on first use
+    
+    Shared across requests so the HTTP connection pool and response cache are reused.
+    
+    Returns:
+        HFClient instance
+    """
+    client = getattr(app.state, "hf_client", None)
+    if client is None:
+        client = _create_hf_client()
+        app.state.hf_client = client
+    return client
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Close database connections on shutdown"""
+def _create_hf_client() -> "HFClient":
+    """Import HF client module and create a client from settings"""
+    from hf.hf_client import HFClient
+    
+    settings = get_settings()
+    # Semantic cache is opt-in: paraphrased prompts reuse earlier answers above this similarity
+    return HFClient(
+        api_key=settings.hf_token,
+        semantic_cache_threshold=settings.hf_semantic_cache_threshold,
+        cache_max_entries=settings.hf_cache_max_entries,
+        cache_ttl_seconds=settings.hf_cache_ttl_seconds
+    )
+
+
+def get_model_parser() -> "ModelParser":
+    """
+    Get shared model response parser, importing and creating it on first use
+    
+    Returns:
+        ModelParser instance
+    """
+    parser = getattr(app.state, "model_parser", None)
+    if parser is None:
+        from database.model_parser import ModelParser
+        
+        parser = ModelParser()
+        app.state.model_parser = parser
+    return parser
 
 
 # class GeminiChatRequest(BaseModel):
@@ -78,748 +240,111 @@ class HFChatRequest(BaseModel):
     model: Optional[str] = Field(default=None, description="Model name (optional, uses default if not specified)")
 
 
+# Built once: validates the raw JSON body in pydantic-core without an intermediate dict
+HF_CHAT_REQUEST_ADAPTER = TypeAdapter(HFChatRequest)
+
+
+def _body_validation_error(error: ValidationError) -> RequestValidationError:
+    """
+    Convert a body validation error to the error FastAPI raises for body parameters
+    
+    Args:
+        error: Error raised by a TypeAdapter validating the raw request body
+    
+    Returns:
+        RequestValidationError with each loc prefixed by "body", as FastAPI reports it
+    """
+    return RequestValidationError([{**err, "loc": ("body", *err["loc"])} for err in error.errors()])
+
+
+# Fields of parsed model output not returned by /hf/chat, built once instead of per request
+PARSED_DATA_EXCLUDE = {"raw_comment_id"}
+
+
 # Database will be initialized on startup
 # Access via get_database() function
 
 
+def _asset_version(name: str) -> str:
+    """
+    Get content hash of a static asset for cache-busting URLs
+    
+    Args:
+        name: File name inside STATIC_DIR
+    
+    Returns:
+        Short hex digest of the file content
+    """
+    with open(os.path.join(STATIC_DIR, name), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+# Landing page is read and compressed once at import instead of per request.
+# Asset URLs get a content hash so the immutable cache is dropped on every change.
+with open(os.path.join(STATIC_DIR, "index.html"), encoding="utf-8") as f:
+    ROOT_HTML = f.read()
+for asset in ("app.css", "app.js"):
+    ROOT_HTML = ROOT_HTML.replace(f'/static/{asset}"', f'/static/{asset}?v={_asset_version(asset)}"')
+ROOT_HTML_BYTES = ROOT_HTML.encode("utf-8")
+# Precompressed variants; GZipMiddleware would recompress on every request
+ROOT_HTML_GZIP = gzip.compress(ROOT_HTML_BYTES, compresslevel=9)
+ROOT_HTML_BROTLI = brotli.compress(ROOT_HTML_BYTES, quality=11) if brotli is not None else None
+# Page changes only on deploy: browsers revalidate hourly and get 304 while it is unchanged.
+# Weak ETag, so all encodings of the same page share it.
+ROOT_ETAG = f'W/"{hashlib.sha256(ROOT_HTML_BYTES).hexdigest()[:16]}"'
+# Newest of the page and its assets, whole seconds as sent in HTTP dates
+ROOT_LAST_MODIFIED_TS = int(max(
+    os.path.getmtime(os.path.join(STATIC_DIR, name)) for name in ("index.html", "app.css", "app.js")
+))
+ROOT_CACHE_HEADERS = {
+    "ETag": ROOT_ETAG,
+    "Last-Modified": formatdate(ROOT_LAST_MODIFIED_TS, usegmt=True),
+    "Cache-Control": "public, max-age=3600, must-revalidate",
+    "Vary": "Accept-Encoding",
+}
+
+
+def _not_modified_since(if_modified_since: Optional[str]) -> bool:
+    """
+    Check If-Modified-Since header against the landing page modification time
+    
+    Args:
+        if_modified_since: Header value, None if not sent
+    
+    Returns:
+        True if the page has not changed since that date, False otherwise (or if the date is invalid)
+    """
+    if not if_modified_since:
+        return False
+    try:
+        return ROOT_LAST_MODIFIED_TS <= parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+
+
 @app.get("/", response_class=HTMLResponse)
-async def root():
+async def root(req: Request):
     """Main page with service information"""
+    if_none_match = req.headers.get("if-none-match")
+    if if_none_match:
+        if if_none_match == "*" or ROOT_ETAG in if_none_match:
+            return Response(status_code=304, headers=ROOT_CACHE_HEADERS)
+    elif _not_modified_since(req.headers.get("if-modified-since")):
+        # If-Modified-Since only counts when the client sent no ETag (RFC 9110)
+        return Response(status_code=304, headers=ROOT_CACHE_HEADERS)
     
-    html_content = """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Gaado Backend API</title>
-        <style>
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                padding: 20px;
-            }
-            .container {
-                background: white;
-                border-radius: 20px;
-                box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-                max-width: 800px;
-                width: 100%;
-                padding: 40px;
-            }
-            h1 {
-                color: #667eea;
-                font-size: 2.5em;
-                margin-bottom: 10px;
-                text-align: center;
-            }
-            .subtitle {
-                color: #666;
-                text-align: center;
-                margin-bottom: 30px;
-                font-size: 1.1em;
-            }
-            .status {
-                display: inline-block;
-                background: #10b981;
-                color: white;
-                padding: 5px 15px;
-                border-radius: 20px;
-                font-size: 0.9em;
-                margin-bottom: 30px;
-            }
-            .info-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                gap: 20px;
-                margin-bottom: 30px;
-            }
-            .info-card {
-                background: #f8f9fa;
-                padding: 20px;
-                border-radius: 10px;
-                border-left: 4px solid #667eea;
-            }
-            .info-card h3 {
-                color: #333;
-                font-size: 0.9em;
-                margin-bottom: 10px;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            }
-            .info-card p {
-                color: #667eea;
-                font-size: 1.5em;
-                font-weight: bold;
-            }
-            .links {
-                display: flex;
-                flex-wrap: wrap;
-                gap: 15px;
-                margin-top: 30px;
-            }
-            .link {
-                display: inline-block;
-                padding: 12px 24px;
-                background: #667eea;
-                color: white;
-                text-decoration: none;
-                border-radius: 8px;
-                transition: all 0.3s ease;
-                font-weight: 500;
-            }
-            .link:hover {
-                background: #5568d3;
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-            }
-            .link.secondary {
-                background: #6b7280;
-            }
-            .link.secondary:hover {
-                background: #4b5563;
-            }
-            .endpoints {
-                margin-top: 30px;
-                padding-top: 30px;
-                border-top: 2px solid #e5e7eb;
-            }
-            .endpoints h2 {
-                color: #333;
-                margin-bottom: 20px;
-                font-size: 1.5em;
-            }
-            .endpoint {
-                background: #f8f9fa;
-                padding: 15px;
-                border-radius: 8px;
-                margin-bottom: 10px;
-                font-family: 'Courier New', monospace;
-                font-size: 0.9em;
-            }
-            .method {
-                display: inline-block;
-                padding: 4px 8px;
-                border-radius: 4px;
-                font-weight: bold;
-                margin-right: 10px;
-                font-size: 0.8em;
-            }
-            .method.get {
-                background: #10b981;
-                color: white;
-            }
-            .method.post {
-                background: #3b82f6;
-                color: white;
-            }
-            .method.delete {
-                background: #ef4444;
-                color: white;
-            }
-            .scraper-section {
-                margin-top: 30px;
-                padding: 25px;
-                background: #f8f9fa;
-                border-radius: 10px;
-                border: 2px solid #667eea;
-            }
-            .scraper-section h2 {
-                color: #667eea;
-                margin-bottom: 20px;
-                font-size: 1.5em;
-            }
-            .scraper-form {
-                display: flex;
-                gap: 10px;
-                margin-bottom: 20px;
-                align-items: flex-start;
-            }
-            .scraper-form input,
-            .scraper-form textarea {
-                flex: 1;
-                padding: 12px;
-                border: 2px solid #e5e7eb;
-                border-radius: 8px;
-                font-size: 1em;
-                font-family: inherit;
-            }
-            .scraper-form input:focus,
-            .scraper-form textarea:focus {
-                outline: none;
-                border-color: #667eea;
-            }
-            .scraper-form textarea {
-                min-height: 80px;
-                resize: vertical;
-            }
-            .scraper-form button {
-                padding: 12px 30px;
-                background: #667eea;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 1em;
-                font-weight: 500;
-                cursor: pointer;
-                transition: all 0.3s ease;
-            }
-            .scraper-form button:hover {
-                background: #5568d3;
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-            }
-            .scraper-form button:disabled {
-                background: #9ca3af;
-                cursor: not-allowed;
-                transform: none;
-            }
-            .result-container {
-                margin-top: 20px;
-                padding: 20px;
-                background: white;
-                border-radius: 10px;
-                border-left: 4px solid #10b981;
-                display: none;
-            }
-            .result-container.show {
-                display: block;
-            }
-            .result-container.error {
-                border-left-color: #ef4444;
-            }
-            .result-header {
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-                margin-bottom: 15px;
-            }
-            .result-header h3 {
-                color: #333;
-                margin: 0;
-            }
-            .result-stats {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-                gap: 15px;
-                margin-bottom: 20px;
-            }
-            .stat-item {
-                background: #f8f9fa;
-                padding: 15px;
-                border-radius: 8px;
-                text-align: center;
-            }
-            .stat-item .stat-label {
-                font-size: 0.85em;
-                color: #666;
-                margin-bottom: 5px;
-            }
-            .stat-item .stat-value {
-                font-size: 1.5em;
-                font-weight: bold;
-                color: #667eea;
-            }
-            .post-content {
-                background: #f8f9fa;
-                padding: 15px;
-                border-radius: 8px;
-                margin-bottom: 15px;
-                white-space: pre-wrap;
-                word-wrap: break-word;
-            }
-            .reactions-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(100px, 1fr));
-                gap: 10px;
-                margin-bottom: 15px;
-            }
-            .reaction-item {
-                background: white;
-                padding: 10px;
-                border-radius: 6px;
-                text-align: center;
-                border: 1px solid #e5e7eb;
-            }
-            .reaction-item .reaction-type {
-                font-weight: bold;
-                color: #667eea;
-                margin-bottom: 5px;
-            }
-            .reaction-item .reaction-count {
-                font-size: 1.2em;
-                color: #333;
-            }
-            .comments-list {
-                max-height: 300px;
-                overflow-y: auto;
-                margin-top: 15px;
-            }
-            .comment-item {
-                background: white;
-                padding: 12px;
-                border-radius: 6px;
-                margin-bottom: 10px;
-                border-left: 3px solid #667eea;
-            }
-            .comment-author {
-                font-weight: bold;
-                color: #667eea;
-                margin-bottom: 5px;
-            }
-            .comment-text {
-                color: #333;
-                margin-bottom: 5px;
-            }
-            .comment-meta {
-                font-size: 0.85em;
-                color: #666;
-            }
-            .loading {
-                display: none;
-                text-align: center;
-                padding: 20px;
-                color: #667eea;
-            }
-            .loading.show {
-                display: block;
-            }
-            .spinner {
-                border: 3px solid #f3f3f3;
-                border-top: 3px solid #667eea;
-                border-radius: 50%;
-                width: 30px;
-                height: 30px;
-                animation: spin 1s linear infinite;
-                margin: 0 auto 10px;
-            }
-            @keyframes spin {
-                0% { transform: rotate(0deg); }
-                100% { transform: rotate(360deg); }
-            }
-            .navbar {
-                background: white;
-                padding: 15px 0;
-                margin-bottom: 30px;
-                border-bottom: 2px solid #e5e7eb;
-            }
-            .nav-links {
-                display: flex;
-                gap: 20px;
-                justify-content: center;
-            }
-            .nav-link {
-                color: #667eea;
-                text-decoration: none;
-                font-weight: 500;
-                padding: 8px 16px;
-                border-radius: 6px;
-                transition: all 0.3s ease;
-            }
-            .nav-link:hover {
-                background: #f8f9fa;
-            }
-            .nav-link.active {
-                background: #667eea;
-                color: white;
-            }
-        </style>
-        <script>
-            // Безопасное форматирование даты
-            function formatDate(dateValue) {
-                if (!dateValue) return 'Дата не указана';
-                try {
-                    const date = new Date(dateValue);
-                    if (isNaN(date.getTime())) return 'Неверная дата';
-                    return date.toLocaleString('ru-RU');
-                } catch (e) {
-                    console.error('Ошибка форматирования даты:', e, dateValue);
-                    return 'Ошибка даты';
-                }
-            }
-            
-            function displayResult(data) {
-                const container = document.getElementById('result-container');
-                const pageInfo = data.page_info || {};
-                const post = data.post || {};
-                const reactions = data.reactions || {};
-                const comments = data.comments || {};
-                
-                console.log('Displaying result:', { pageInfo, post, reactions, comments });
-                
-                let html = `
-                    <div class="result-header">
-                        <h3>📄 ${pageInfo.name || pageInfo.username || 'Страница'}</h3>
-                        <span style="color: #666; font-size: 0.9em;">${data.fetched_at ? formatDate(data.fetched_at) : 'Только что'}</span>
-                    </div>
-                `;
-                
-                if (post.text) {
-                    html += `
-                        <div class="post-content">${escapeHtml(post.text)}</div>
-                        <div class="result-stats">
-                            <div class="stat-item">
-                                <div class="stat-label">Лайки</div>
-                                <div class="stat-value">${post.likes || 0}</div>
-                            </div>
-                            <div class="stat-item">
-                                <div class="stat-label">Комментарии</div>
-                                <div class="stat-value">${comments.total_count || 0}</div>
-                            </div>
-                            <div class="stat-item">
-                                <div class="stat-label">Репосты</div>
-                                <div class="stat-value">${post.shares || 0}</div>
-                            </div>
-                            <div class="stat-item">
-                                <div class="stat-label">Реакций всего</div>
-                                <div class="stat-value">${reactions.total_reactions || 0}</div>
-                            </div>
-                        </div>
-                    `;
-                    
-                    if (reactions.reactions_by_type && Object.keys(reactions.reactions_by_type).length > 0) {
-                        html += '<h4 style="margin: 15px 0 10px 0; color: #333;">Реакции по типам:</h4><div class="reactions-grid">';
-                        for (const [type, count] of Object.entries(reactions.reactions_by_type)) {
-                            if (count > 0) {
-                                html += `
-                                    <div class="reaction-item">
-                                        <div class="reaction-type">${type}</div>
-                                        <div class="reaction-count">${count}</div>
-                                    </div>
-                                `;
-                            }
-                        }
-                        html += '</div>';
-                    }
-                    
-                    if (comments.comments && comments.comments.length > 0) {
-                        html += '<h4 style="margin: 20px 0 10px 0; color: #333;">Комментарии:</h4><div class="comments-list">';
-                        comments.comments.slice(0, 10).forEach(comment => {
-                            let commentTime = '';
-                            if (comment.time) {
-                                try {
-                                    const date = new Date(comment.time);
-                                    if (!isNaN(date.getTime())) {
-                                        commentTime = date.toLocaleString('ru-RU');
-                                    }
-                                } catch (e) {
-                                    // Игнорируем ошибки парсинга даты
-                                }
-                            }
-                            html += `
-                                <div class="comment-item">
-                                    <div class="comment-author">${escapeHtml(comment.author || 'Аноним')}</div>
-                                    <div class="comment-text">${escapeHtml(comment.text || '')}</div>
-                                    <div class="comment-meta">❤️ ${comment.likes || 0}${commentTime ? ' • ' + commentTime : ''}</div>
-                                </div>
-                            `;
-                        });
-                        if (comments.total_count > 10) {
-                            html += `<div style="text-align: center; color: #666; margin-top: 10px;">... и еще ${comments.total_count - 10} комментариев</div>`;
-                        }
-                        html += '</div>';
-                    }
-                } else if (data.error) {
-                    html += `<p style="color: #ef4444;">${escapeHtml(data.error)}</p>`;
-                }
-                
-                container.innerHTML = html;
-                container.classList.add('show');
-                container.classList.remove('error');
-            }
-            
-            function showError(message) {
-                const container = document.getElementById('result-container');
-                container.innerHTML = `
-                    <div class="result-header">
-                        <h3 style="color: #ef4444;">❌ Ошибка</h3>
-                    </div>
-                    <p style="color: #ef4444;">${escapeHtml(message)}</p>
-                `;
-                container.classList.add('show', 'error');
-            }
-            
-            function escapeHtml(text) {
-                const div = document.createElement('div');
-                div.textContent = text;
-                return div.innerHTML;
-            }
-            
-            // async function chatGemini() {
-            //     const prompt = document.getElementById('gemini-prompt').value.trim();
-            //     const button = document.getElementById('gemini-chat-btn');
-            //     const loading = document.getElementById('gemini-loading');
-            //     const resultContainer = document.getElementById('gemini-result-container');
-            //     
-            //     if (!prompt) {
-            //         alert('Please enter a prompt');
-            //         return;
-            //     }
-            //     
-            //     // Показываем загрузку
-            //     button.disabled = true;
-            //     loading.classList.add('show');
-            //     resultContainer.classList.remove('show');
-            //     
-            //     try {
-            //         const response = await fetch('/gemini/chat', {
-            //             method: 'POST',
-            //             headers: {
-            //                 'Content-Type': 'application/json',
-            //             },
-            //             body: JSON.stringify({ prompt: prompt })
-            //         });
-            //         
-            //         if (!response.ok) {
-            //             const errorText = await response.text();
-            //             console.error('HTTP Error:', response.status, errorText);
-            //             showGeminiError(`Ошибка сервера (${response.status}): ${errorText}`);
-            //             return;
-            //         }
-            //         
-            //         const data = await response.json();
-            //         console.log('Response data:', data);
-            //         
-            //         if (data.success) {
-            //             // Отображаем результат
-            //             displayGeminiResult(data.response, prompt, data.parsed_data);
-            //             
-            //             // Сохраняем в БД если есть parsed_data
-            //             if (data.parsed_data) {
-            //                 await saveProcessedCommentToDatabase(data.parsed_data, prompt);
-            //             }
-            //         } else {
-            //             showGeminiError(data.error || 'Произошла ошибка при обработке запроса');
-            //         }
-            //     } catch (error) {
-            //         console.error('Request error:', error);
-            //         showGeminiError('Ошибка соединения: ' + error.message);
-            //     } finally {
-            //         button.disabled = false;
-            //         loading.classList.remove('show');
-            //     }
-            // }
-            
-            async function chatHF() {
-                const prompt = document.getElementById('hf-prompt').value.trim();
-                const button = document.getElementById('hf-chat-btn');
-                const loading = document.getElementById('hf-loading');
-                const resultContainer = document.getElementById('hf-result-container');
-                
-                if (!prompt) {
-                    alert('Please enter a prompt');
-                    return;
-                }
-                
-                // Показываем загрузку
-                button.disabled = true;
-                loading.classList.add('show');
-                resultContainer.classList.remove('show');
-                
-                try {
-                    const response = await fetch('/hf/chat', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify({ prompt: prompt })
-                    });
-                    
-                    if (!response.ok) {
-                        const errorText = await response.text();
-                        console.error('HTTP Error:', response.status, errorText);
-                        showHFError(`Ошибка сервера (${response.status}): ${errorText}`);
-                        return;
-                    }
-                    
-                    const data = await response.json();
-                    console.log('Response data:', data);
-                    
-                    if (data.success) {
-                        // Отображаем результат
-                        displayHFResult(data.response, prompt, data.parsed_data);
-                        
-                        // Сохраняем в БД если есть parsed_data
-                        if (data.parsed_data) {
-                            await saveProcessedCommentToDatabase(data.parsed_data, prompt);
-                        }
-                    } else {
-                        showHFError(data.error || 'Произошла ошибка при обработке запроса');
-                    }
-                } catch (error) {
-                    console.error('Request error:', error);
-                    showHFError('Ошибка соединения: ' + error.message);
-                } finally {
-                    button.disabled = false;
-                    loading.classList.remove('show');
-                }
-            }
-            
-            async function saveProcessedCommentToDatabase(parsedData, somaliText) {
-                // Генерируем временные ID для демонстрации (в реальном приложении они должны приходить из формы)
-                const fbCommentId = 'hf_' + Date.now() + '_' + Math.random().toString(36).substr(2, 9);
-                const postId = 1; // Прикрепляем к реальному посту
-                
-                try {
-                    const response = await fetch('/hf/save', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify({
-                            fb_comment_id: fbCommentId,
-                            post_id: postId,
-                            translation_en: parsedData.translation_en,
-                            threat_level_slug: parsedData.threat_level_slug,
-                            confidence_score: parsedData.confidence_score,
-                            dialect: parsedData.dialect,
-                            keywords: parsedData.keywords,
-                            somali_text: somaliText || parsedData.somali_text,
-                            risk: parsedData.risk,
-                            model_name: parsedData.model_name
-                        })
-                    });
-                    
-                    const saveResult = await response.json();
-                    
-                    if (saveResult.success) {
-                        console.log('Successfully saved to database:', saveResult);
-                    } else {
-                        console.warn('Failed to save to database:', saveResult.error);
-                    }
-                } catch (error) {
-                    console.error('Error saving to database:', error);
-                }
-            }
-            
-            // function displayGeminiResult(response, prompt) {
-            //     const container = document.getElementById('gemini-result-container');
-            //     
-            //     let html = `
-            //         <div class="result-header">
-            //             <h3>🤖 Response from Gemini</h3>
-            //         </div>
-            //         <div style="margin-bottom: 15px;">
-            //             <strong style="color: #667eea;">Request:</strong>
-            //             <div style="background: #f8f9fa; padding: 10px; border-radius: 8px; margin-top: 5px; white-space: pre-wrap;">${escapeHtml(prompt)}</div>
-            //         </div>
-            //         <div>
-            //             <strong style="color: #667eea;">Response:</strong>
-            //             <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin-top: 5px; white-space: pre-wrap; word-wrap: break-word;">${escapeHtml(response)}</div>
-            //         </div>
-            //     `;
-            //     
-            //     container.innerHTML = html;
-            //     container.classList.add('show');
-            //     container.classList.remove('error');
-            // }
-            // 
-            // function showGeminiError(message) {
-            //     const container = document.getElementById('gemini-result-container');
-            //     container.innerHTML = `
-            //         <div class="result-header">
-            //             <h3 style="color: #ef4444;">❌ Ошибка</h3>
-            //         </div>
-            //         <p style="color: #ef4444;">${escapeHtml(message)}</p>
-            //     `;
-            //     container.classList.add('show', 'error');
-            // }
-            
-            function displayHFResult(response, prompt) {
-                const container = document.getElementById('hf-result-container');
-                
-                let html = `
-                    <div class="result-header">
-                        <h3>🤖 Response from Hugging Face</h3>
-                    </div>
-                    <div style="margin-bottom: 15px;">
-                        <strong style="color: #667eea;">Request:</strong>
-                        <div style="background: #f8f9fa; padding: 10px; border-radius: 8px; margin-top: 5px; white-space: pre-wrap;">${escapeHtml(prompt)}</div>
-                    </div>
-                    <div>
-                        <strong style="color: #667eea;">Response:</strong>
-                        <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin-top: 5px; white-space: pre-wrap; word-wrap: break-word;">${escapeHtml(response)}</div>
-                    </div>
-                `;
-                
-                container.innerHTML = html;
-                container.classList.add('show');
-                container.classList.remove('error');
-            }
-            
-            function showHFError(message) {
-                const container = document.getElementById('hf-result-container');
-                container.innerHTML = `
-                    <div class="result-header">
-                        <h3 style="color: #ef4444;">❌ Ошибка</h3>
-                    </div>
-                    <p style="color: #ef4444;">${escapeHtml(message)}</p>
-                `;
-                container.classList.add('show', 'error');
-            }
-            
-        </script>
-    </head>
-    <body>
-        <div class="container">
-            <nav class="navbar">
-                <div class="nav-links">
-                    <a href="/" class="nav-link active">Home</a>
-                    <a href="/comments" class="nav-link">Feed</a>
-                </div>
-            </nav>
-            
-            <h1>🚀 Gaado Backend API</h1>
-            
-            
-            <!-- <div class="scraper-section">
-                <h2>✨ Google Gemini Chat</h2>
-                <p style="color: #666; font-size: 0.85em; margin-top: -10px; margin-bottom: 20px; font-style: italic;">translate this from somali to english</p>
-                <div class="scraper-form">
-                    <textarea 
-                        id="gemini-prompt" 
-                        placeholder="Input your prompt here..."
-                    >Waa bankiga kaliya ee dadkiisa cilada heesato ku xaliyo ka wada bax dib usoo bilaaw tirtir ee dib usoo daji</textarea>
-                    <button id="gemini-chat-btn" onclick="chatGemini()">Send</button>
-                </div>
-                <div id="gemini-loading" class="loading">
-                    <div class="spinner"></div>
-                    <p>Response-request with AI.</p>
-                </div>
-                <div id="gemini-result-container" class="result-container"></div>
-            </div> -->
-            
-            <div class="scraper-section">
-                <h2>✨ Hugging Face Chat</h2>
-                <p style="color: #666; font-size: 0.85em; margin-top: -10px; margin-bottom: 20px; font-style: italic;">translate this from somali to english</p>
-                <div class="scraper-form">
-                    <textarea 
-                        id="hf-prompt" 
-                        placeholder="Input your prompt here..."
-                    >Waa bankiga kaliya ee dadkiisa cilada heesato ku xaliyo ka wada bax dib usoo bilaaw tirtir ee dib usoo daji</textarea>
-                    <button id="hf-chat-btn" onclick="chatHF()">Send</button>
-                </div>
-                <div id="hf-loading" class="loading">
-                    <div class="spinner"></div>
-                    <p>Response-request with AI.</p>
-                </div>
-                <div id="hf-result-container" class="result-container"></div>
-            </div>
-            
-        </div>
-    </body>
-    </html>
-    """
-    return HTMLResponse(content=html_content)
+    accepted = accepted_encodings(req.headers.get("accept-encoding", ""))
+    if ROOT_HTML_BROTLI is not None and "br" in accepted:
+        body, content_encoding = ROOT_HTML_BROTLI, "br"
+    elif "gzip" in accepted:
+        body, content_encoding = ROOT_HTML_GZIP, "gzip"
+    else:
+        return HTMLResponse(content=ROOT_HTML_BYTES, headers=ROOT_CACHE_HEADERS)
+    
+    return HTMLResponse(
+        content=body,
+        headers={**ROOT_CACHE_HEADERS, "Content-Encoding": content_encoding}
+    )
 
 
 
@@ -881,23 +406,24 @@ async def root():
 
 
 @app.post("/hf/chat")
-async def chat_with_hf(request: HFChatRequest, req: Request):
+async def chat_with_hf(req: Request):
     """
     Endpoint for chatting with Hugging Face model
     
     Args:
-        request: Request with prompt text and optional model name
-        req: FastAPI Request object for accessing environment variables
+        req: FastAPI Request object with prompt text and optional model name as JSON body
         
     Returns:
         Response from AI model
     """
     try:
-        # Get API key from environment variable
-        hf_api_key = os.getenv("HF_TOKEN")
-        
-        # Create client with API key
-        client = HFClient(api_key=hf_api_key)
+        request = HF_CHAT_REQUEST_ADAPTER.validate_json(await req.body())
+    except ValidationError as e:
+        raise _body_validation_error(e)
+    
+    try:
+        # Client is created once, on the first chat request
+        client = get_hf_client()
         
         if not client.is_available():
             return {
@@ -906,13 +432,13 @@ async def chat_with_hf(request: HFChatRequest, req: Request):
             }
         
         # Process user request - all logic is encapsulated in the client
-        response = client.process_user_request(
+        response = await client.aprocess_user_request(
             user_prompt=request.prompt,
             model=request.model
         )
         
         # Parse response using ModelParser
-        parser = ModelParser()
+        parser = get_model_parser()
         processed_comment_data = parser.parse_ai_response(response)
         
         # Get model name used
@@ -922,7 +448,7 @@ async def chat_with_hf(request: HFChatRequest, req: Request):
         parsed_data_dict = None
         if processed_comment_data:
             # Use model_dump() to serialize, excluding raw_comment_id
-            parsed_data_dict = processed_comment_data.model_dump(exclude={"raw_comment_id"})
+            parsed_data_dict = processed_comment_data.model_dump(mode="json", exclude=PARSED_DATA_EXCLUDE)
             # Add somali_text from original prompt and model_name
             parsed_data_dict["somali_text"] = request.prompt
             parsed_data_dict["model_name"] = model_name_used
@@ -934,45 +460,212 @@ async def chat_with_hf(request: HFChatRequest, req: Request):
             "parsed_data": parsed_data_dict
         }
     except Exception as e:
-        logger.error(f"Error processing HF request: {e}", exc_info=True)
+        # Tracebacks only in DEBUG: formatting them on every failure is costly during upstream outages
+        logger.error("Error processing HF request: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return {
             "success": False,
             "error": f"Internal error: {str(e)}"
         }
 
 
+# Built once: validates the raw JSON body in pydantic-core without an intermediate dict
+SAVE_REQUEST_ADAPTER = TypeAdapter(SaveProcessedCommentRequest)
+
+
+# Failure responses are immutable and shared instead of rebuilt per request
+SAVE_FAILED = SaveProcessedCommentResponse(success=False, error="Failed to save comment to database")
+SAVE_RAW_FAILED = SaveProcessedCommentResponse(success=False, error="Failed to save raw comment to database")
+SAVE_PROCESSED_FAILED = SaveProcessedCommentResponse(success=False, error="Failed to save processed comment to database")
+SAVE_QUEUED = {"success": True, "queued": True}
+
+# Recently saved comments keyed by fb_comment_id: client retries of the same
+# comment get the earlier result without touching the database
+RECENT_SAVES: "TTLCache[str, Any]" = TTLCache(
+    maxsize=get_settings().save_dedup_max_entries,
+    ttl=get_settings().save_dedup_ttl_seconds
+)
+
+
+def _remember_save(save_key: str, result: Any) -> None:
+    """Record save result for duplicate requests; SAVE_DEDUP_MAX_ENTRIES=0 disables it"""
+    if RECENT_SAVES.maxsize:
+        RECENT_SAVES[save_key] = result
+
+
+# Database circuit breaker: after consecutive connection/timeout failures, reject saves
+# with 503 for a while instead of stacking requests on a struggling database.
+# Statements the database rejects (duplicates, bad post_id) do not count: callers cannot trip it.
+# When the cooldown ends the circuit is half-open: one probe save goes through, the rest
+# keep getting 503 until the probe closes the circuit (or another cooldown passes).
+DB_CIRCUIT_FAILURE_THRESHOLD = 10
+DB_CIRCUIT_COOLDOWN_SECONDS = 30.0
+DB_UNAVAILABLE = {"success": False, "error": "Database unavailable, retry later"}
+_db_consecutive_failures = 0
+_db_circuit_open_until = 0.0
+_db_circuit_half_open = False
+
+
+def _db_circuit_retry_after() -> int:
+    """
+    Seconds until a save may reach the database, 0 if it may go now
+    
+    Admits the half-open probe: the first caller after the cooldown gets 0 and
+    the next probe slot is pushed one cooldown ahead.
+    """
+    global _db_circuit_open_until, _db_circuit_half_open
+    
+    if not _db_circuit_open_until:
+        return 0
+    now = time.monotonic()
+    remaining = _db_circuit_open_until - now
+    if remaining > 0:
+        return math.ceil(remaining)
+    _db_circuit_half_open = True
+    _db_circuit_open_until = now + DB_CIRCUIT_COOLDOWN_SECONDS
+    return 0
+
+
+def _record_db_success() -> None:
+    """Reset the database failure counter and close the circuit"""
+    global _db_consecutive_failures, _db_circuit_open_until, _db_circuit_half_open
+    
+    _db_consecutive_failures = 0
+    if _db_circuit_open_until:
+        logger.info("Database circuit closed")
+        _db_circuit_open_until = 0.0
+        _db_circuit_half_open = False
+
+
+def _record_db_failure() -> None:
+    """Count a database connection failure and open the circuit at the threshold"""
+    global _db_consecutive_failures, _db_circuit_open_until
+    
+    if _db_circuit_half_open:
+        # Probe failed: stay open for another cooldown
+        _db_circuit_open_until = time.monotonic() + DB_CIRCUIT_COOLDOWN_SECONDS
+        logger.warning("Database circuit probe failed, reopened for %.0fs", DB_CIRCUIT_COOLDOWN_SECONDS)
+        return
+    
+    _db_consecutive_failures += 1
+    if _db_consecutive_failures >= DB_CIRCUIT_FAILURE_THRESHOLD:
+        _db_circuit_open_until = time.monotonic() + DB_CIRCUIT_COOLDOWN_SECONDS
+        _db_consecutive_failures = 0
+        logger.warning("Database circuit opened for %.0fs", DB_CIRCUIT_COOLDOWN_SECONDS)
+
+
 # @app.post("/gemini/save")
 # async def save_processed_comment(request: SaveProcessedCommentRequest):
-@app.post("/hf/save")
-async def save_processed_comment_hf(request: SaveProcessedCommentRequest):
+@app.post(
+    "/hf/save",
+    response_model=SaveProcessedCommentResponse,
+    response_model_exclude_none=True,
+    responses={
+        202: {
+            "description": "Comment queued for write-behind (COMMENT_WRITE_BEHIND enabled)",
+            "content": {"application/json": {"example": SAVE_QUEUED}},
+        },
+        503: {
+            "description": "Database circuit is open, retry after the Retry-After header",
+            "content": {"application/json": {"example": DB_UNAVAILABLE}},
+        },
+    },
+)
+async def save_processed_comment_hf(req: Request) -> Union[SaveProcessedCommentResponse, Response]:
     """
     Endpoint for saving processed comment to database
     
     Args:
-        request: Request with processed comment data
+        req: FastAPI Request object with processed comment data as JSON body
         
     Returns:
-        Success status and saved comment data
+        Success status and saved comment data, or 202 response if the comment was queued
     """
     try:
-        # First, create raw comment
-        raw_comment = add_raw_comment(
+        request = SAVE_REQUEST_ADAPTER.validate_json(await req.body())
+    except ValidationError as e:
+        raise _body_validation_error(e)
+    
+    save_key = request.fb_comment_id
+    previous = RECENT_SAVES.get(save_key)
+    if previous is not None:
+        logger.info("Duplicate comment save skipped")
+        return previous if previous is not SAVE_QUEUED else ORJSONResponse(status_code=202, content=SAVE_QUEUED)
+    
+    comment = {
+        "fb_comment_id": request.fb_comment_id,
+        "post_id": request.post_id,
+        "content": request.somali_text,
+        "translation_en": request.translation_en,
+        "threat_level_slug": request.threat_level_slug,
+        "confidence_score": request.confidence_score,
+        "dialect": request.dialect,
+        "keywords": request.keywords,
+        "risk": request.risk,
+        "model_name": request.model_name,
+        "is_reviewed": False
+    }
+    
+    write_queue = get_write_queue()
+    if write_queue is not None:
+        try:
+            write_queue.put_nowait(comment)
+            _remember_save(save_key, SAVE_QUEUED)
+            return ORJSONResponse(status_code=202, content=SAVE_QUEUED)
+        except asyncio.QueueFull:
+            logger.warning("Write queue is full, saving comment directly")
+    
+    retry_after = _db_circuit_retry_after()
+    if retry_after:
+        return ORJSONResponse(status_code=503, content=DB_UNAVAILABLE, headers={"Retry-After": str(retry_after)})
+    
+    pool = get_database().pool
+    if pool is not None:
+        # Both inserts in one statement over a pooled asyncpg connection
+        try:
+            saved = await add_comment_with_processing_async(pool, **comment)
+        except DatabaseUnavailableError:
+            _record_db_failure()
+            return SAVE_FAILED
+        # The database answered, even if it rejected the statement
+        _record_db_success()
+        if not saved:
+            logger.warning("Failed to save comment to database")
+            return SAVE_FAILED
+        
+        raw_comment_id = saved["raw_comment"]["id"]
+        logger.info("Successfully saved comment to database: raw_comment_id=%s", raw_comment_id)
+        response = SaveProcessedCommentResponse(
+            success=True,
+            raw_comment_id=raw_comment_id,
+            processed_comment=saved["processed_comment"]
+        )
+        _remember_save(save_key, response)
+        return response
+    
+    # Supabase client is synchronous, so DB calls run in a worker thread to keep the loop free
+    # First, create raw comment
+    try:
+        raw_comment = await asyncio.to_thread(
+            add_raw_comment,
             fb_comment_id=request.fb_comment_id,
             post_id=request.post_id,
-            content=request.somali_text or ""
+            content=request.somali_text
         )
-        
-        if not raw_comment or not raw_comment.get("id"):
-            logger.warning("Failed to save raw comment to database")
-            return {
-                "success": False,
-                "error": "Failed to save raw comment to database"
-            }
-        
-        raw_comment_id = raw_comment["id"]
-        
-        # Then, create processed comment
-        processed_comment = add_processed_comment(
+    except DatabaseUnavailableError:
+        _record_db_failure()
+        return SAVE_RAW_FAILED
+    _record_db_success()
+    
+    if not raw_comment or not raw_comment.get("id"):
+        logger.warning("Failed to save raw comment to database")
+        return SAVE_RAW_FAILED
+    
+    raw_comment_id = raw_comment["id"]
+    
+    # Then, create processed comment
+    try:
+        processed_comment = await asyncio.to_thread(
+            add_processed_comment,
             raw_comment_id=raw_comment_id,
             translation_en=request.translation_en,
             threat_level_slug=request.threat_level_slug,
@@ -983,37 +676,72 @@ async def save_processed_comment_hf(request: SaveProcessedCommentRequest):
             model_name=request.model_name,
             is_reviewed=False
         )
-        
-        if processed_comment:
-            logger.info(f"Successfully saved comment to database: raw_comment_id={raw_comment_id}")
-            return {
-                "success": True,
-                "raw_comment_id": raw_comment_id,
-                "processed_comment": processed_comment
-            }
-        else:
-            logger.warning("Failed to save processed comment to database")
-            return {
-                "success": False,
-                "error": "Failed to save processed comment to database"
-            }
-            
-    except Exception as e:
-        logger.error(f"Error saving to database: {e}", exc_info=True)
-        return {
-            "success": False,
-            "error": f"Internal error: {str(e)}"
-        }
+    except DatabaseUnavailableError:
+        _record_db_failure()
+        return SAVE_PROCESSED_FAILED
+    
+    if processed_comment:
+        logger.info("Successfully saved comment to database: raw_comment_id=%s", raw_comment_id)
+        response = SaveProcessedCommentResponse(
+            success=True,
+            raw_comment_id=raw_comment_id,
+            processed_comment=processed_comment
+        )
+        _remember_save(save_key, response)
+        return response
+    else:
+        logger.warning("Failed to save processed comment to database")
+        return SAVE_PROCESSED_FAILED
 
 
-@app.get("/health")
-async def health_check():
-    return {"status": "ok"}
-    
 # Error handlers
+@functools.lru_cache(maxsize=256)
+def _http_error_body(status_code: int, detail: str) -> bytes:
+    """Serialize HTTP error body once per (status, detail); bounded, since detail may echo client input"""
+    return orjson.dumps({"error": detail, "status_code": status_code})
+
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
-    return JSONResponse(
+    if isinstance(exc.detail, str):
+        return Response(
+            content=_http_error_body(exc.status_code, exc.detail),
+            status_code=exc.status_code,
+            media_type="application/json",
+            headers=exc.headers
+        )
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content={"error": exc.detail, "status_code": exc.status_code}
-    )
\ No newline at end of file
+        content={"error": exc.detail, "status_code": exc.status_code},
+        headers=exc.headers
+    )
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request, exc):
+    # Handlers stay free of catch-all try blocks; unexpected errors end up here.
+    # Not logged: Starlette's ServerErrorMiddleware re-raises after sending this
+    # response, and uvicorn logs the traceback once.
+    return ORJSONResponse(
+        status_code=500,
+        content={"success": False, "error": f"Internal error: {str(exc)}"}
+    )
+
+
+if __name__ == "__main__":
+    import importlib.util
+    import uvicorn
+    
+    # uvloop event loop and httptools parser are installed by uvicorn[standard];
+    # fall back to uvicorn's defaults when running with plain uvicorn
+    uvloop_available = importlib.util.find_spec("uvloop") is not None
+    httptools_available = importlib.util.find_spec("httptools") is not None
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        # Separate processes so one busy worker does not stall the others
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        loop="uvloop" if uvloop_available else "auto",
+        http="httptools" if httptools_available else "auto"
+    )
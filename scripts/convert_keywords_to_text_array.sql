@@ -0,0 +1,20 @@
+-- Migration: Store processed_comments.keywords as TEXT[] instead of JSONB
+-- Run this in Supabase SQL Editor once, before deploying the matching backend
+-- asyncpg sends Python lists as native arrays, so inserts skip the JSON encode/parse step
+
+-- ALTER ... USING cannot contain a subquery, so the conversion goes through a helper function
+CREATE OR REPLACE FUNCTION keywords_jsonb_to_text_array(value JSONB) RETURNS TEXT[]
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT CASE
+        WHEN value IS NULL THEN NULL
+        WHEN jsonb_typeof(value) = 'array' THEN ARRAY(SELECT jsonb_array_elements_text(value))
+        ELSE ARRAY[value #>> '{}']
+    END
+$$;
+
+ALTER TABLE processed_comments
+ALTER COLUMN keywords TYPE TEXT[] USING keywords_jsonb_to_text_array(keywords);
+
+DROP FUNCTION keywords_jsonb_to_text_array(JSONB);
+
+COMMENT ON COLUMN processed_comments.keywords IS 'List of extracted keywords (e.g., {scam,error})';
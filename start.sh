@@ -18,4 +18,4 @@ pip install -q -r requirements.txt
 
 # Запуск сервера
 echo "Запуск сервера на http://localhost:8000"
-uvicorn main:app --reload --host 0.0.0.0 --port 8000
+uvicorn main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
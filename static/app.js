@@ -0,0 +1,340 @@
+// Один форматтер на страницу: toLocaleString создает его заново при каждом вызове
+const DATE_FORMAT = new Intl.DateTimeFormat('ru-RU', {
+    year: 'numeric', month: 'numeric', day: 'numeric',
+    hour: 'numeric', minute: 'numeric', second: 'numeric'
+});
+
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+
+// Безопасное форматирование даты
+function formatDate(dateValue) {
+    if (!dateValue) return 'Дата не указана';
+    try {
+        const date = new Date(dateValue);
+        if (isNaN(date.getTime())) return 'Неверная дата';
+        return DATE_FORMAT.format(date);
+    } catch (e) {
+        console.error('Ошибка форматирования даты:', e, dateValue);
+        return 'Ошибка даты';
+    }
+}
+
+function displayResult(data) {
+    const container = document.getElementById('result-container');
+    const pageInfo = data.page_info || {};
+    const post = data.post || {};
+    const reactions = data.reactions || {};
+    const comments = data.comments || {};
+
+    console.log('Displaying result:', { pageInfo, post, reactions, comments });
+
+    // Части собираются в массив и склеиваются один раз
+    const parts = [`
+        <div class="result-header">
+            <h3>📄 ${pageInfo.name || pageInfo.username || 'Страница'}</h3>
+            <span style="color: #666; font-size: 0.9em;">${data.fetched_at ? formatDate(data.fetched_at) : 'Только что'}</span>
+        </div>
+    `];
+
+    if (post.text) {
+        parts.push(`
+            <div class="post-content">${escapeHtml(post.text)}</div>
+            <div class="result-stats">
+                <div class="stat-item">
+                    <div class="stat-label">Лайки</div>
+                    <div class="stat-value">${post.likes || 0}</div>
+                </div>
+                <div class="stat-item">
+                    <div class="stat-label">Комментарии</div>
+                    <div class="stat-value">${comments.total_count || 0}</div>
+                </div>
+                <div class="stat-item">
+                    <div class="stat-label">Репосты</div>
+                    <div class="stat-value">${post.shares || 0}</div>
+                </div>
+                <div class="stat-item">
+                    <div class="stat-label">Реакций всего</div>
+                    <div class="stat-value">${reactions.total_reactions || 0}</div>
+                </div>
+            </div>
+        `);
+
+        if (reactions.reactions_by_type && Object.keys(reactions.reactions_by_type).length > 0) {
+            parts.push('<h4 style="margin: 15px 0 10px 0; color: #333;">Реакции по типам:</h4><div class="reactions-grid">');
+            for (const [type, count] of Object.entries(reactions.reactions_by_type)) {
+                if (count > 0) {
+                    parts.push(`
+                        <div class="reaction-item">
+                            <div class="reaction-type">${type}</div>
+                            <div class="reaction-count">${count}</div>
+                        </div>
+                    `);
+                }
+            }
+            parts.push('</div>');
+        }
+
+        if (comments.comments && comments.comments.length > 0) {
+            parts.push('<h4 style="margin: 20px 0 10px 0; color: #333;">Комментарии:</h4><div class="comments-list">');
+            comments.comments.slice(0, 10).forEach(comment => {
+                let commentTime = '';
+                if (comment.time) {
+                    try {
+                        const date = new Date(comment.time);
+                        if (!isNaN(date.getTime())) {
+                            commentTime = DATE_FORMAT.format(date);
+                        }
+                    } catch (e) {
+                        // Игнорируем ошибки парсинга даты
+                    }
+                }
+                parts.push(`
+                    <div class="comment-item">
+                        <div class="comment-author">${escapeHtml(comment.author || 'Аноним')}</div>
+                        <div class="comment-text">${escapeHtml(comment.text || '')}</div>
+                        <div class="comment-meta">❤️ ${comment.likes || 0}${commentTime ? ' • ' + commentTime : ''}</div>
+                    </div>
+                `);
+            });
+            if (comments.total_count > 10) {
+                parts.push(`<div style="text-align: center; color: #666; margin-top: 10px;">... и еще ${comments.total_count - 10} комментариев</div>`);
+            }
+            parts.push('</div>');
+        }
+    } else if (data.error) {
+        parts.push(`<p style="color: #ef4444;">${escapeHtml(data.error)}</p>`);
+    }
+
+    container.innerHTML = parts.join('');
+    container.classList.add('show');
+    container.classList.remove('error');
+}
+
+function showError(message) {
+    const container = document.getElementById('result-container');
+    container.innerHTML = `
+        <div class="result-header">
+            <h3 style="color: #ef4444;">❌ Ошибка</h3>
+        </div>
+        <p style="color: #ef4444;">${escapeHtml(message)}</p>
+    `;
+    container.classList.add('show', 'error');
+}
+
+// Экранирование без создания DOM-элемента
+function escapeHtml(text) {
+    return String(text ?? '').replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+}
+
+// async function chatGemini() {
+//     const prompt = document.getElementById('gemini-prompt').value.trim();
+//     const button = document.getElementById('gemini-chat-btn');
+//     const loading = document.getElementById('gemini-loading');
+//     const resultContainer = document.getElementById('gemini-result-container');
+//     
+//     if (!prompt) {
+//         alert('Please enter a prompt');
+//         return;
+//     }
+//     
+//     // Показываем загрузку
+//     button.disabled = true;
+//     loading.classList.add('show');
+//     resultContainer.classList.remove('show');
+//     
+//     try {
+//         const response = await fetch('/gemini/chat', {
+//             method: 'POST',
+//             headers: {
+//                 'Content-Type': 'application/json',
+//             },
+//             body: JSON.stringify({ prompt: prompt })
+//         });
+//         
+//         if (!response.ok) {
+//             const errorText = await response.text();
+//             console.error('HTTP Error:', response.status, errorText);
+//             showGeminiError(`Ошибка сервера (${response.status}): ${errorText}`);
+//             return;
+//         }
+//         
+//         const data = await response.json();
+//         console.log('Response data:', data);
+//         
+//         if (data.success) {
+//             // Отображаем результат
+//             displayGeminiResult(data.response, prompt, data.parsed_data);
+//             
+//             // Сохраняем в БД если есть parsed_data
+//             if (data.parsed_data) {
+//                 await saveProcessedCommentToDatabase(data.parsed_data, prompt);
+//             }
+//         } else {
+//             showGeminiError(data.error || 'Произошла ошибка при обработке запроса');
+//         }
+//     } catch (error) {
+//         console.error('Request error:', error);
+//         showGeminiError('Ошибка соединения: ' + error.message);
+//     } finally {
+//         button.disabled = false;
+//         loading.classList.remove('show');
+//     }
+// }
+
+async function chatHF() {
+    const prompt = document.getElementById('hf-prompt').value.trim();
+    const button = document.getElementById('hf-chat-btn');
+    const loading = document.getElementById('hf-loading');
+    const resultContainer = document.getElementById('hf-result-container');
+
+    if (!prompt) {
+        alert('Please enter a prompt');
+        return;
+    }
+
+    // Показываем загрузку
+    button.disabled = true;
+    loading.classList.add('show');
+    resultContainer.classList.remove('show');
+
+    try {
+        const response = await fetch('/hf/chat', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ prompt: prompt })
+        });
+
+        if (!response.ok) {
+            const errorText = await response.text();
+            console.error('HTTP Error:', response.status, errorText);
+            showHFError(`Ошибка сервера (${response.status}): ${errorText}`);
+            return;
+        }
+
+        const data = await response.json();
+        console.log('Response data:', data);
+
+        if (data.success) {
+            // Отображаем результат
+            displayHFResult(data.response, prompt, data.parsed_data);
+
+            // Сохраняем в БД если есть parsed_data
+            if (data.parsed_data) {
+                await saveProcessedCommentToDatabase(data.parsed_data, prompt);
+            }
+        } else {
+            showHFError(data.error || 'Произошла ошибка при обработке запроса');
+        }
+    } catch (error) {
+        console.error('Request error:', error);
+        showHFError('Ошибка соединения: ' + error.message);
+    } finally {
+        button.disabled = false;
+        loading.classList.remove('show');
+    }
+}
+
+async function saveProcessedCommentToDatabase(parsedData, somaliText) {
+    // Генерируем временные ID для демонстрации (в реальном приложении они должны приходить из формы)
+    const fbCommentId = 'hf_' + Date.now() + '_' + Math.random().toString(36).substr(2, 9);
+    const postId = 1; // Прикрепляем к реальному посту
+
+    try {
+        const response = await fetch('/hf/save', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                fb_comment_id: fbCommentId,
+                post_id: postId,
+                translation_en: parsedData.translation_en,
+                threat_level_slug: parsedData.threat_level_slug,
+                confidence_score: parsedData.confidence_score,
+                dialect: parsedData.dialect,
+                keywords: parsedData.keywords,
+                somali_text: somaliText || parsedData.somali_text,
+                risk: parsedData.risk,
+                model_name: parsedData.model_name
+            })
+        });
+
+        const saveResult = await response.json();
+
+        if (saveResult.success) {
+            console.log('Successfully saved to database:', saveResult);
+        } else {
+            console.warn('Failed to save to database:', saveResult.error);
+        }
+    } catch (error) {
+        console.error('Error saving to database:', error);
+    }
+}
+
+// function displayGeminiResult(response, prompt) {
+//     const container = document.getElementById('gemini-result-container');
+//     
+//     let html = `
+//         <div class="result-header">
+//             <h3>🤖 Response from Gemini</h3>
+//         </div>
+//         <div style="margin-bottom: 15px;">
+//             <strong style="color: #667eea;">Request:</strong>
+//             <div style="background: #f8f9fa; padding: 10px; border-radius: 8px; margin-top: 5px; white-space: pre-wrap;">${escapeHtml(prompt)}</div>
+//         </div>
+//         <div>
+//             <strong style="color: #667eea;">Response:</strong>
+//             <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin-top: 5px; white-space: pre-wrap; word-wrap: break-word;">${escapeHtml(response)}</div>
+//         </div>
+//     `;
+//     
+//     container.innerHTML = html;
+//     container.classList.add('show');
+//     container.classList.remove('error');
+// }
+// 
+// function showGeminiError(message) {
+//     const container = document.getElementById('gemini-result-container');
+//     container.innerHTML = `
+//         <div class="result-header">
+//             <h3 style="color: #ef4444;">❌ Ошибка</h3>
+//         </div>
+//         <p style="color: #ef4444;">${escapeHtml(message)}</p>
+//     `;
+//     container.classList.add('show', 'error');
+// }
+
+function displayHFResult(response, prompt) {
+    const container = document.getElementById('hf-result-container');
+
+    let html = `
+        <div class="result-header">
+            <h3>🤖 Response from Hugging Face</h3>
+        </div>
+        <div style="margin-bottom: 15px;">
+            <strong style="color: #667eea;">Request:</strong>
+            <div style="background: #f8f9fa; padding: 10px; border-radius: 8px; margin-top: 5px; white-space: pre-wrap;">${escapeHtml(prompt)}</div>
+        </div>
+        <div>
+            <strong style="color: #667eea;">Response:</strong>
+            <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; margin-top: 5px; white-space: pre-wrap; word-wrap: break-word;">${escapeHtml(response)}</div>
+        </div>
+    `;
+
+    container.innerHTML = html;
+    container.classList.add('show');
+    container.classList.remove('error');
+}
+
+function showHFError(message) {
+    const container = document.getElementById('hf-result-container');
+    container.innerHTML = `
+        <div class="result-header">
+            <h3 style="color: #ef4444;">❌ Ошибка</h3>
+        </div>
+        <p style="color: #ef4444;">${escapeHtml(message)}</p>
+    `;
+    container.classList.add('show', 'error');
+}